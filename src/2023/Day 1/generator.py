@@ -0,0 +1,32 @@
+"""
+Synthetic calibration documents: `size` is the number of lines.
+
+Every line holds at least one digit (part 1 needs it) mixed with random letters
+and spelled out digits, including overlapping ones like "oneight".
+"""
+import random
+import string
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+OVERLAPPING = ["oneight", "twone", "threeight", "fiveight", "sevenine", "eightwo", "eighthree"]
+
+
+def generate_line(rng: random.Random, max_tokens: int = 8) -> str:
+    tokens = [rng.choice(string.digits[1:])]
+    for _ in range(rng.randint(1, max_tokens)):
+        kind = rng.random()
+        if kind < 0.4:
+            tokens.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 6))))
+        elif kind < 0.75:
+            tokens.append(rng.choice(WORDS))
+        elif kind < 0.85:
+            tokens.append(rng.choice(OVERLAPPING))
+        else:
+            tokens.append(rng.choice(string.digits[1:]))
+    rng.shuffle(tokens)
+    return "".join(tokens)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "\n".join(generate_line(rng) for _ in range(size)) + "\n"
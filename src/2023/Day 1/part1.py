@@ -1,19 +1,29 @@
+import sys
 from pathlib import Path 
 from typing import List
 
 SCRIPT_DIR = Path(__file__).parent.absolute()
 INPUT_FILE = SCRIPT_DIR / 'input.txt'
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.days import load_module
+
+scanner = load_module(SCRIPT_DIR / 'scanner.py')
 
 
 def get_calibration_values(text: str) -> List[int]:
     values = []
     for line in text.strip().split("\n"):
-        digits = [c for c in line if c.isdigit()]
-        val = int(digits[0] + digits[-1])
-        values.append(val)
+        first = next(c for c in line if c.isdigit())
+        last = next(c for c in reversed(line) if c.isdigit())
+        values.append(int(first + last))
     return values
 
 
+def part1(text: str) -> int:
+    return scanner.calibration_sum(text.encode())
+
+
 def run_tests():
     text = """
     1abc2
@@ -23,12 +33,13 @@ def run_tests():
     """
     expected = [12, 38, 15, 77]
     assert get_calibration_values(text) == expected
+    assert part1(text) == sum(expected)
 
 
 if __name__ == '__main__':
     run_tests()
 
     with INPUT_FILE.open() as f:
-        res = sum(get_calibration_values(f.read()))
+        res = part1(f.read())
         
     print("1st answer:", res)
\ No newline at end of file
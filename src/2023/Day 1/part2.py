@@ -1,9 +1,15 @@
+import sys
 from pathlib import Path 
 from typing import List
 import re
 
 SCRIPT_DIR = Path(__file__).parent.absolute()
 INPUT_FILE = SCRIPT_DIR / 'input.txt'
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.days import load_module
+
+scanner = load_module(SCRIPT_DIR / 'scanner.py')
 
 NAMES_TO_DIGITS = {
     "one": "1",
@@ -17,12 +23,13 @@ NAMES_TO_DIGITS = {
     "nine": "9",
 }
 
+# positive lookahead to find overlapping matches (e.g "oneight")
+DIGITS_RE = re.compile(r"(?=({0}))|\d".format('|'.join(NAMES_TO_DIGITS)))
+
 
 def get_digits(line: str) -> List[int]:
-    # positive lookahead to find overlapping matches (e.g "oneight")
-    pat = "(?=({0}))|\d".format('|'.join(NAMES_TO_DIGITS))
     numbers = []
-    for match in re.finditer(pat, line):
+    for match in DIGITS_RE.finditer(line):
         if match.group(0).isdigit():
             num = match.group(0)
         else:
@@ -32,12 +39,16 @@ def get_digits(line: str) -> List[int]:
 
 
 def get_calibration_value(line: str) -> int:
-    digits = get_digits(line)
-    return 10*digits[0] + digits[-1]
+    return calibration_values_sum(line)
 
 
 def calibration_values_sum(text: str) -> int:
-    return sum(get_calibration_value(line) for line in text.strip().split("\n"))
+    # only the first and last digits matter, see scanner.py
+    return scanner.calibration_sum(scanner.spell_out_digits(text.encode()))
+
+
+def part2(text: str) -> int:
+    return calibration_values_sum(text)
 
 
 def run_tests():
@@ -56,6 +67,9 @@ def run_tests():
     assert get_digits("oneasaseight") == [1, 8]
     assert get_digits("oneight") == [1, 8]
     assert get_digits("1aa2bbthreeccfour") == [1, 2, 3, 4]
+    assert get_calibration_value("xtwone3four") == 24
+
+    scanner.tests()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,113 @@
+"""
+Calibration sums of both parts in one scan of a (possibly huge) document.
+
+Usage:
+
+    python scanner.py calibration.txt -j 8 --chunk-size 64
+
+Only the first and the last digit of a line matter, and the sum of the
+calibration values is 10 times the sum of the first digits plus the sum of the
+last ones, so the digits never have to be paired up. Everything runs as bulk
+bytes operations over a whole chunk: every byte but the digits and the line
+breaks is deleted, then the first digits are the ones following a line break
+and the last digits the ones preceding one, so the sums come down to counting
+"\n1", "1\n", "\n2"... in it.
+
+For part 2 the digit words are first replaced by their digit, keeping their
+first and last letters ("eight" -> "e888t", the same length is a faster
+replace). Digit words overlap by one letter at most, so "oneight" still
+becomes "o1e888t".
+
+Files are memory-mapped and cut into chunks of whole lines, each scanned by a
+worker process that maps the file on its own: nothing is copied but the sums.
+"""
+
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Optional
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.streams import build_parser, chunk_bounds, report
+
+DIGIT_WORDS = [b"one", b"two", b"three", b"four", b"five", b"six", b"seven", b"eight", b"nine"]
+NOT_DIGITS = bytes(c for c in range(256) if c not in b"0123456789\n")
+
+CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def spell_out_digits(buffer: bytes) -> bytes:
+    for digit, word in enumerate(DIGIT_WORDS, start=1):
+        middle = str(digit).encode() * (len(word) - 2)
+        buffer = buffer.replace(word, word[:1] + middle + word[-1:])
+    return buffer
+
+
+def calibration_sum(buffer: bytes) -> int:
+    """Sum of the calibration values of the lines of `buffer`, lines without digits count 0."""
+    digits = b"\n" + buffer.translate(None, NOT_DIGITS) + b"\n"
+    return sum(
+        10 * d * digits.count(b"\n%d" % d) + d * digits.count(b"%d\n" % d) for d in range(1, 10)
+    )
+
+
+def scan(buffer: bytes) -> tuple[int, int]:
+    return calibration_sum(buffer), calibration_sum(spell_out_digits(buffer))
+
+
+def _scan_chunk(path: Path, start: int, end: int) -> tuple[int, int]:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        return scan(buffer[start:end])
+
+
+def scan_file(
+    path: Path, chunk_size: int = CHUNK_SIZE, jobs: Optional[int] = None
+) -> tuple[int, int]:
+    """Part 1 and part 2 sums of a calibration document, over `jobs` processes."""
+    if os.path.getsize(path) == 0:
+        return 0, 0
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        bounds = chunk_bounds(buffer, chunk_size, b"\n")
+        if jobs == 1 or len(bounds) == 1:
+            sums = [scan(buffer[start:end]) for start, end in bounds]
+            return sum(s[0] for s in sums), sum(s[1] for s in sums)
+
+    starts, ends = zip(*bounds)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        sums = list(executor.map(_scan_chunk, repeat(path), starts, ends))
+    return sum(s[0] for s in sums), sum(s[1] for s in sums)
+
+
+def tests():
+    text = b"1abc2\npqr3stu8vwx\na1b2c3d4e5f\ntreb7uchet\n"
+    assert calibration_sum(text) == 142
+
+    text = b"two1nine\neightwothree\nabcone2threexyz\nxtwone3four\n4nineeightseven2\nzoneight234\n7pqrstsixteen"
+    assert calibration_sum(spell_out_digits(text)) == 281
+    assert spell_out_digits(b"oneight") == b"o1e888t"
+    assert scan(b"nodigits\n5\n\nsevenine") == (55, 55 + 79)
+
+    # chunks smaller than a line still cut on line ends
+    assert chunk_bounds(text, 3, b"\n")[:2] == [(0, 9), (9, 22)]
+    bounds = chunk_bounds(text, 10, b"\n")
+    assert sum(scan(text[start:end])[1] for start, end in bounds) == 281
+
+
+if __name__ == "__main__":
+    tests()
+
+    parser = build_parser(__doc__, SCRIPT_DIR / "input.txt")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE // 2**20, help="MiB per chunk")
+    args = parser.parse_args()
+    report(
+        args.path,
+        ("1st answer:", "2nd answer:"),
+        lambda: scan_file(args.path, args.chunk_size * 2**20, args.jobs),
+    )
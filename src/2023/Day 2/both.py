@@ -1,11 +1,34 @@
+import math
+import random
+import re
+import sys
+from bisect import bisect_left, bisect_right
 from pathlib import Path 
 from dataclasses import dataclass
+from typing import Iterator, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 SCRIPT_DIR = Path(__file__).parent.absolute()
 INPUT_FILE = SCRIPT_DIR / 'input.txt'
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.parsing import int_spans_array
+
+# "3 blue" -> ("3", "blue"), one findall per sample instead of splitting each cube
+CUBES_RE = re.compile(r"(\d+) (red|green|blue)")
+
+COLORS = ("red", "green", "blue")
+if np is not None:
+    # the colors are told apart by the first letter after the count
+    COLOR_COLUMNS = np.full(256, -1, dtype=np.int64)
+    COLOR_COLUMNS[[ord(c[0]) for c in COLORS]] = range(len(COLORS))
 
 
-@dataclass(eq=True)
+@dataclass(eq=True, slots=True)
 class CubesSet:
     red: int = 0
     green: int = 0
@@ -15,14 +38,12 @@ class CubesSet:
     def power(self) -> int:
         return self.red * self.green * self.blue
     
-    def __contains__(self, other: "CubesSet") -> "CubesSet":
-        for color in ["red", "blue", "green"]:
-            if getattr(other, color) > getattr(self, color):
-                return False
-        return True
+    def __contains__(self, other: "CubesSet") -> bool:
+        return other.red <= self.red and other.green <= self.green and other.blue <= self.blue
     
 
 class Game:
+    __slots__ = ("id", "samples")
     BAG = CubesSet(red=12, green=13, blue=14)
     
     def __init__(self, id: id, samples: list[CubesSet]):
@@ -34,16 +55,12 @@ class Game:
     
     @classmethod
     def from_string(cls, line: str) -> "Game":
-        def parse_sample(sample_str: str) -> CubesSet:
-            cubes_sample = {}
-            for cube in sample_str.split(","):
-                qty, color = cube.strip().split(" ")
-                cubes_sample[color] = int(qty)
-            return CubesSet(**cubes_sample)
-        
         id, samples = line.lstrip("Game ").split(":")
         id = int(id)
-        samples = [parse_sample(s) for s in samples.split("; ")]
+        samples = [
+            CubesSet(**{color: int(qty) for qty, color in CUBES_RE.findall(s)})
+            for s in samples.split(";")
+        ]
         return cls(id, samples)
     
     def is_valid(self) -> bool:
@@ -53,26 +70,209 @@ class Game:
         return self.smallest_valid_bag().power
     
     def smallest_valid_bag(self) -> CubesSet:
-        min_sample = CubesSet(
-            red = max(s.red for s in self.samples),
-            green = max(s.green for s in self.samples),
-            blue = max(s.blue for s in self.samples)
-        )
-        return min_sample
-            
-    
-def parse_input() -> list[Game]:
+        return CubesSet(*map(max, zip(*((s.red, s.green, s.blue) for s in self.samples))))
+
+
+@dataclass(slots=True)
+class Games:
+    """
+    Every sample of every game as columns: `cubes` holds one (red, green, blue)
+    row per sample and game i owns the rows offsets[i]:offsets[i + 1]. Indexing
+    gives back a `Game` built from its rows.
+    """
+    ids: "np.ndarray"
+    cubes: "np.ndarray"
+    offsets: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i: int) -> Game:
+        rows = self.cubes[self.offsets[i] : self.offsets[i + 1]].tolist()
+        return Game(int(self.ids[i]), [CubesSet(*row) for row in rows])
+
+    def __iter__(self) -> Iterator[Game]:
+        return (self[i] for i in range(len(self)))
+
+    def smallest_valid_bags(self) -> "np.ndarray":
+        """Column-wise maximum of the samples of each game."""
+        return np.maximum.reduceat(self.cubes, self.offsets[:-1], axis=0)
+
+    def valid(self, bag: CubesSet) -> "np.ndarray":
+        """Mask of the games whose every sample fits in `bag`."""
+        limits = np.array([bag.red, bag.green, bag.blue])
+        return (self.smallest_valid_bags() <= limits).all(axis=1)
+
+
+class BagIndex:
+    """
+    Sum of the ids of the games fitting in any bag, answered from a table built
+    once over the smallest valid bag of every game.
+
+    Each color is reduced to the sorted distinct counts seen in the games, and
+    cell (r, g, b) of the table holds the sum of the ids of the games whose
+    smallest bag is at most the r-th red, g-th green and b-th blue count: a
+    3D prefix sum. A query looks up the largest count not above each of its
+    colors (a binary search per color), then reads one cell. It needs NumPy.
+
+    When the table would be too large, a batch of queries is answered by a
+    sweep instead: games and queries go by increasing red, each game is added
+    to a 2D Fenwick tree over the green and blue ranks before the queries it
+    fits in, and a query sums the tree up to its green and blue ranks. A node
+    of the green tree only keeps the blue ranks of the games it can hold, so
+    the tree takes O(n log n) memory for n games, and a query or an addition
+    O(log^2 n) time.
+    """
+
+    # the table holds one int64 per combination of distinct counts: 32MiB at
+    # most, e.g. 160 distinct counts per color
+    MAX_TABLE_BYTES = 32 * 1024 * 1024
+
+    def __init__(self, games: Games):
+        bags = games.smallest_valid_bags()
+        self.counts = [np.unique(bags[:, c]) for c in range(len(COLORS))]
+        shape = tuple(len(counts) for counts in self.counts)
+        self.table = None
+        if math.prod(shape) * np.dtype(np.int64).itemsize > self.MAX_TABLE_BYTES:
+            self._build_tree(bags, games.ids)
+        else:
+            self._build_table(bags, games.ids, shape)
+
+    def _build_table(self, bags: "np.ndarray", ids: "np.ndarray", shape: tuple[int, ...]) -> None:
+        cells = tuple(np.searchsorted(counts, bags[:, c]) for c, counts in enumerate(self.counts))
+        table = np.zeros(shape, dtype=np.int64)
+        np.add.at(table, cells, ids)
+        for axis in range(table.ndim):
+            np.cumsum(table, axis=axis, out=table)
+        self.table = table
+
+    def _build_tree(self, bags: "np.ndarray", ids: "np.ndarray") -> None:
+        order = np.argsort(bags[:, 0], kind="stable")
+        self.reds = bags[order, 0]
+        self.ids = ids[order]
+        # 1-based ranks, as the Fenwick trees count from 1
+        self.greens = np.searchsorted(self.counts[1], bags[order, 1]) + 1
+        self.blues = np.searchsorted(self.counts[2], bags[order, 2]) + 1
+
+        # the (node, blue rank) pairs of the green tree a game is added to, as
+        # node * stride + rank: sorted, each node owns a slice of the keys
+        self.stride = len(self.counts[2]) + 1
+        size = len(self.counts[1])
+        nodes, blues, keys = self.greens, self.blues, []
+        while len(nodes):
+            keys.append(nodes * self.stride + blues)
+            nodes = nodes + (nodes & -nodes)
+            blues = blues[nodes <= size]
+            nodes = nodes[nodes <= size]
+        self.keys = np.unique(np.concatenate(keys)) if keys else np.zeros(0, dtype=np.int64)
+        self.node_starts = np.searchsorted(self.keys, np.arange(size + 2) * self.stride)
+
+    def query(self, bag: CubesSet) -> int:
+        return int(self.query_many(np.array([[bag.red, bag.green, bag.blue]]))[0])
+
+    def query_many(self, bags: "np.ndarray") -> "np.ndarray":
+        """Sums of the valid ids for each (red, green, blue) row of `bags`."""
+        if self.table is None:
+            return self._sweep(bags)
+        cells = [
+            np.searchsorted(counts, bags[:, c], side="right") - 1
+            for c, counts in enumerate(self.counts)
+        ]
+        # a bag smaller than every game in one of the colors fits none
+        fits_some = np.logical_and.reduce([cell >= 0 for cell in cells])
+        sums = np.zeros(len(bags), dtype=np.int64)
+        sums[fits_some] = self.table[tuple(cell[fits_some] for cell in cells)]
+        return sums
+
+    def _sweep(self, bags: "np.ndarray") -> "np.ndarray":
+        keys, starts, stride = self.keys.tolist(), self.node_starts.tolist(), self.stride
+        greens, blues, ids = self.greens.tolist(), self.blues.tolist(), self.ids.tolist()
+        tree = [0] * len(keys)
+        # games fitting each query in red, and its green and blue ranks (0 below every game)
+        fitting = np.searchsorted(self.reds, bags[:, 0], side="right")
+        green_ranks = np.searchsorted(self.counts[1], bags[:, 1], side="right").tolist()
+        blue_ranks = np.searchsorted(self.counts[2], bags[:, 2], side="right").tolist()
+
+        sums = np.zeros(len(bags), dtype=np.int64)
+        added = 0
+        for q in np.argsort(fitting, kind="stable").tolist():
+            for game in range(added, fitting[q]):
+                node, blue, game_id = greens[game], blues[game], ids[game]
+                while node < len(starts) - 1:
+                    start, end = starts[node], starts[node + 1]
+                    i = bisect_left(keys, node * stride + blue, start, end) - start + 1
+                    while i <= end - start:
+                        tree[start + i - 1] += game_id
+                        i += i & -i
+                    node += node & -node
+            added = max(added, fitting[q])
+
+            total, node = 0, green_ranks[q]
+            while node > 0:
+                start, end = starts[node], starts[node + 1]
+                i = bisect_right(keys, node * stride + blue_ranks[q], start, end) - start
+                while i > 0:
+                    total += tree[start + i - 1]
+                    i -= i & -i
+                node -= node & -node
+            sums[q] = total
+        return sums
+
+
+def parse_data(text: str) -> Union[Games, list[Game]]:
+    # the games are columns when NumPy is available, one Game per line otherwise
+    if np is None:
+        return parse_games(text)
+    return parse_columns(text)
+
+
+def parse_games(text: str) -> list[Game]:
+    return [Game.from_string(line.strip()) for line in text.strip().split("\n")]
+
+
+def parse_columns(text: str) -> Games:
+    buffer = text.encode()
+    values, starts, ends = int_spans_array(buffer)
+    buf = np.frombuffer(buffer, dtype=np.uint8)
+
+    # "Game 12:" ids are followed by a colon, counts by a space and a color
+    is_id = buf[ends] == ord(":")
+    # a sample starts at the colon after the id and at each semicolon
+    separators = np.flatnonzero((buf == ord(":")) | (buf == ord(";")))
+    counts = ~is_id
+    sample = np.searchsorted(separators, starts[counts]) - 1
+    column = COLOR_COLUMNS[buf[ends[counts] + 1]]
+
+    cubes = np.zeros((len(separators), len(COLORS)), dtype=np.int64)
+    cubes[sample, column] = values[counts]
+    offsets = np.append(np.flatnonzero(buf[separators] == ord(":")), len(separators))
+    return Games(values[is_id], cubes, offsets)
+
+
+def parse_input() -> Union[Games, list[Game]]:
     with INPUT_FILE.open() as f:
-        games = [Game.from_string(line) for line in f]
+        games = parse_data(f.read())
     return games
         
         
-def sum_valid_ids(games: list[Game]) -> int:
-    return sum(g.id for g in games if g.is_valid())    
+def sum_valid_ids(games: Union[Games, list[Game]], bag: CubesSet = Game.BAG) -> int:
+    if isinstance(games, list):
+        return sum(g.id for g in games if g.smallest_valid_bag() in bag)
+    return int(games.ids[games.valid(bag)].sum())
+
+
+def total_least_power(games: Union[Games, list[Game]]) -> int:
+    if isinstance(games, list):
+        return sum(g.get_least_power() for g in games)
+    return int(games.smallest_valid_bags().prod(axis=1).sum())
+
+
+def part1(games: Union[Games, list[Game]]) -> int:
+    return sum_valid_ids(games)
 
 
-def total_least_power(games: list[Game]) -> int:
-    return sum(g.get_least_power() for g in games)
+def part2(games: Union[Games, list[Game]]) -> int:
+    return total_least_power(games)
 
 
 def run_tests():
@@ -83,7 +283,7 @@ def run_tests():
         Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red
         Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green
     """
-    games = [Game.from_string(line) for line in games_str.strip().split("\n")]
+    games = parse_data(games_str)
 
     g = games[0]
     assert g.samples[0] == CubesSet(blue=3, red=4, green=0)
@@ -100,6 +300,38 @@ def run_tests():
     assert sum_valid_ids(games) == 8
     assert total_least_power(games) == 2286
 
+    bags = [Game.BAG, CubesSet(), CubesSet(20, 20, 20), CubesSet(6, 3, 6), CubesSet(4, 2, 6)]
+    games_list = parse_games(games_str)
+    assert [sum_valid_ids(games_list, bag) for bag in bags] == [8, 0, 15, 8, 1]
+    assert total_least_power(games_list) == 2286
+
+    if np is not None:
+        index = BagIndex(games)
+        for bag in bags:
+            assert index.query(bag) == sum_valid_ids(games, bag)
+        assert index.query_many(np.array([[b.red, b.green, b.blue] for b in bags])).tolist() == [8, 0, 15, 8, 1]
+
+        # counts too varied for the table: the sweep gives the same sums
+        rng = random.Random(2)
+
+        def sample() -> str:
+            colors = rng.sample(COLORS, rng.randint(1, len(COLORS)))
+            return ", ".join(f"{rng.randint(1, 1000)} {color}" for color in colors)
+
+        lines = [f"Game {i}: " + "; ".join(sample() for _ in range(4)) for i in range(1, 301)]
+        many_games = parse_data("\n".join(lines))
+        index = BagIndex(many_games)
+        assert index.table is None
+        bags = [CubesSet(*(rng.randint(0, 1100) for _ in COLORS)) for _ in range(200)]
+        bags += [Game.BAG, CubesSet(), CubesSet(1000, 1000, 1000)]
+        expected = [sum_valid_ids(many_games, bag) for bag in bags]
+        assert index.query_many(np.array([[b.red, b.green, b.blue] for b in bags])).tolist() == expected
+        assert index.query(CubesSet(1000, 1000, 1000)) == sum(range(1, 301))
+
+    for line, g in zip(games_str.strip().splitlines(), games):
+        parsed = Game.from_string(line.strip())
+        assert (parsed.id, parsed.samples) == (g.id, g.samples)
+
 
 if __name__ == "__main__":
     run_tests()
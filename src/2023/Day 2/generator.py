@@ -0,0 +1,22 @@
+"""
+Synthetic game records: `size` is the number of games.
+"""
+import random
+
+COLORS = ["red", "green", "blue"]
+
+
+def generate_sample(rng: random.Random, max_cubes: int) -> str:
+    colors = rng.sample(COLORS, k=rng.randint(1, len(COLORS)))
+    return ", ".join(f"{rng.randint(1, max_cubes)} {color}" for color in colors)
+
+
+def generate(size: int, seed: int = 0, max_samples: int = 6, max_cubes: int = 20) -> str:
+    rng = random.Random(seed)
+    lines = []
+    for game_id in range(1, size + 1):
+        samples = [
+            generate_sample(rng, max_cubes) for _ in range(rng.randint(1, max_samples))
+        ]
+        lines.append(f"Game {game_id}: " + "; ".join(samples))
+    return "\n".join(lines) + "\n"
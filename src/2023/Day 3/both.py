@@ -1,77 +1,108 @@
+import re
+import sys
+from array import array
+from bisect import bisect_right
 from pathlib import Path 
-from typing import Iterator, Callable
+from typing import Callable
 from dataclasses import dataclass
 
 SCRIPT_DIR = Path(__file__).parent.absolute()
 INPUT_FILE = SCRIPT_DIR / 'input.txt'
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.days import load_module
+from aoc.grid import Grid
+
+# line by line version for schematics that don't fit in memory
+streaming = load_module(SCRIPT_DIR / 'streaming.py')
+
+# positions are flat indices into the grid, padded with "." so that neighbors
+# of edge cells need no bounds checks and numbers end at the end of each row
+EMPTY = b"."
+
 
 def load_input() -> str:
     with INPUT_FILE.open() as f:
         return f.read()
 
 
+def load_grid(eng_schema: str) -> Grid:
+    return Grid.from_text(eng_schema, border=EMPTY)
+
+
 # ---------- PART 1 ----------             
-        
-def numbers_with_digit_positions(text: str) -> Iterator[tuple[int, list[int, int]]]: 
-    """ yields each number in text and the corresponding digit positions """
-    for i, line in enumerate(text.strip().split("\n")):
-        num = ""
-        digit_positions = []
-        for j, chr in enumerate(line.strip()):
-            if chr.isdigit():
-                digit_positions.append((i, j))
-                num += chr
-            else:
-                if num:
-                    yield (int(num), digit_positions)
-                    num = ""
-                    digit_positions = []
-        if num:            
-            yield (int(num), digit_positions)
+
+NUMBER_RE = re.compile(rb"\d+")
+
+
+@dataclass(slots=True)
+class NumberIndex:
+    """
+    The numbers of the grid as spans of flat indices: number i has the value
+    values[i] and covers starts[i] to ends[i] (exclusive). Numbers never cross
+    the border, so sorted by start they are the spans of each row one row
+    after the other, and the numbers around a cell are found by bisecting
+    the rows above, at and below it. A number keeps its own id, so equal
+    values next to the same gear still count twice.
+    """
+    values: array
+    starts: array
+    ends: array
+
+    @classmethod
+    def from_grid(cls, grid: Grid) -> "NumberIndex":
+        index = cls(array("q"), array("q"), array("q"))
+        for match in NUMBER_RE.finditer(grid.cells):
+            index.values.append(int(match[0]))
+            index.starts.append(match.start())
+            index.ends.append(match.end())
+        return index
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def around(self, grid: Grid, pos: int) -> list[int]:
+        """Ids of the numbers touching any of the 8 neighbors of `pos`."""
+        starts, ends = self.starts, self.ends
+        ids = []
+        for center in (pos - grid.width, pos, pos + grid.width):
+            # numbers are at least one cell apart: no more than 2 touch 3 cells
+            i = bisect_right(starts, center + 1) - 1
+            while i >= 0 and ends[i] >= center:
+                ids.append(i)
+                i -= 1
+        return ids
             
             
 def get_char_positions(
-    eng_schema: str, 
+    grid: Grid, 
     predicate: Callable[[str], bool]
-) -> set[tuple[int, int]]:
+) -> set[int]:
+    # the predicate is evaluated once per byte value rather than once per cell
+    table = bytes(predicate(chr(c)) for c in range(256))
+    matches = grid.cells.translate(table)
     chr_positions = set()
-    for i, line in enumerate(eng_schema.strip().split("\n")):
-        for j, chr in enumerate(line.strip()):
-            if predicate(chr):
-                chr_positions.add((i, j))
+    idx = matches.find(1)
+    while idx != -1:
+        # skip the "." border, in case the predicate accepts it
+        if grid.in_bounds(*grid.position(idx)):
+            chr_positions.add(idx)
+        idx = matches.find(1, idx + 1)
     return chr_positions
 
 
-def neighbors(chr_pos: tuple[int, int]) -> list[tuple[int, int]]:
-    i, j = chr_pos
-    neighs = [
-        (i-1, j-1), (i-1, j), (i-1, j+1),
-        (i, j-1), (i, j+1),  
-        (i+1, j-1), (i+1, j), (i+1, j+1)
-    ]
-    return neighs
-
-
 def is_symbol(chr: str) -> bool:
     return (not chr.isdigit()) and (chr != ".")
 
 
-def is_adjacent_to_symbol(
-    chr_pos: tuple[int, int], 
-    sym_positions: set[tuple[int, int]]
-) -> bool:
-    return any(neigh_pos in sym_positions for neigh_pos in neighbors(chr_pos))
-
-
 def get_part_numbers(eng_schema: str) -> list[int]:
-    part_nums = []
-    sym_positions = get_char_positions(eng_schema, is_symbol)
-    for num, digit_positions in numbers_with_digit_positions(eng_schema):
-        for (i, j) in digit_positions:
-            if is_adjacent_to_symbol((i, j), sym_positions):
-                part_nums.append(num)
-                break
-    return part_nums
+    grid = load_grid(eng_schema)
+    numbers = NumberIndex.from_grid(grid)
+    is_part = bytearray(len(numbers))
+    for pos in get_char_positions(grid, is_symbol):
+        for i in numbers.around(grid, pos):
+            is_part[i] = 1
+    return [num for num, part in zip(numbers.values, is_part) if part]
 
 
 def part_numbers_sum(eng_schema: str) -> int:
@@ -80,9 +111,9 @@ def part_numbers_sum(eng_schema: str) -> int:
 
 # ---------- PART 2 ---------- 
 
-@dataclass
+@dataclass(slots=True)
 class Gear:
-    pos: tuple[int, int]
+    pos: int
     numbers: list[int]
     
     @property
@@ -90,26 +121,15 @@ class Gear:
         return self.numbers[0] * self.numbers[1]
 
 
-def get_numbers_lkp(eng_schema: str) -> dict[tuple[int, int], int]:
-    num_lkp = {}
-    for num, digit_positions in numbers_with_digit_positions(eng_schema):
-        for pos in digit_positions:
-            num_lkp[pos] = num
-    return num_lkp
-
-
 def get_gears(eng_schema: str) -> list[Gear]:
-    gear_candidates_pos = get_char_positions(eng_schema, lambda chr: chr == "*")
-    nums_lkp = get_numbers_lkp(eng_schema)
+    grid = load_grid(eng_schema)
+    numbers = NumberIndex.from_grid(grid)
     gears = []
     
-    for pos in gear_candidates_pos:
-        gear_neigh_nums = {
-            nums_lkp[neigh_pos] for neigh_pos in neighbors(pos)
-            if neigh_pos in nums_lkp
-        }
-        if len(gear_neigh_nums) == 2:
-            gear = Gear(pos, list(gear_neigh_nums))
+    for pos in grid.find(b"*"):
+        gear_neigh_ids = numbers.around(grid, pos)
+        if len(gear_neigh_ids) == 2:
+            gear = Gear(pos, [numbers.values[i] for i in gear_neigh_ids])
             gears.append(gear)
     
     return gears
@@ -119,6 +139,14 @@ def gear_ratio_sum(eng_schema: str) -> int:
     return sum(gear.ratio for gear in get_gears(eng_schema))
 
 
+def part1(eng_schema: str) -> int:
+    return part_numbers_sum(eng_schema)
+
+
+def part2(eng_schema: str) -> int:
+    return gear_ratio_sum(eng_schema)
+
+
 def run_tests():
     eng_schema = """
         467..114..
@@ -135,6 +163,11 @@ def run_tests():
     assert get_part_numbers(eng_schema) == [467, 35, 633, 617, 592, 755, 664, 598]
     assert part_numbers_sum(eng_schema) == 4361
     assert gear_ratio_sum(eng_schema) == 467835
+    # equal numbers around a gear are two numbers
+    assert gear_ratio_sum("12*12") == 144
+    assert gear_ratio_sum("7..\n.*.\n..7") == 49
+    assert get_part_numbers("1.1\n.*.\n1..") == [1, 1, 1]
+    streaming.tests()
     
     
 if __name__ == '__main__':
@@ -0,0 +1,33 @@
+"""
+Synthetic engine schematics: `size` is the side of the (square) schematic.
+
+Numbers of 1-3 digits are scattered over a background of dots, always separated
+from each other by at least one dot, together with a sprinkle of symbols where
+about a third of them are gears (`*`).
+"""
+import random
+
+SYMBOLS = "#$%&+-/=@"
+
+
+def generate(
+    size: int,
+    seed: int = 0,
+    number_density: float = 0.12,
+    symbol_density: float = 0.05,
+) -> str:
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            draw = rng.random()
+            if draw < number_density and (not row or not row[-1].isdigit()):
+                width = min(rng.randint(1, 3), size - len(row))
+                row.extend(str(rng.randint(10 ** (width - 1), 10**width - 1)))
+            elif draw < number_density + symbol_density:
+                row.append("*" if rng.random() < 0.35 else rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        rows.append("".join(row))
+    return "\n".join(rows) + "\n"
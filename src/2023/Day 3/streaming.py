@@ -0,0 +1,149 @@
+"""
+Part numbers and gear ratios of an engine schematic read one line at a time.
+
+Usage:
+
+    python streaming.py schematic.txt
+
+A number or a gear only ever touches the rows right above and below its own,
+so only three rows are kept: each row is handled once the next one has been
+read, and its part numbers and gear ratios are emitted right away. Memory is
+bounded by the width of the schematic, whatever its height.
+
+A row keeps the columns of its numbers (start, end exclusive), their values
+and the columns of its symbols and gears, all sorted, so adjacency comes down
+to a few bisections in the three rows.
+"""
+
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.streams import build_parser, report
+
+NUMBER_RE = re.compile(rb"\d+")
+SYMBOL_RE = re.compile(rb"[^\d.]")
+
+
+@dataclass(slots=True)
+class Row:
+    starts: list[int] = field(default_factory=list)
+    ends: list[int] = field(default_factory=list)
+    values: list[int] = field(default_factory=list)
+    symbols: list[int] = field(default_factory=list)
+    gears: list[int] = field(default_factory=list)
+
+
+def parse_row(line: bytes) -> Row:
+    row = Row()
+    for match in NUMBER_RE.finditer(line):
+        row.starts.append(match.start())
+        row.ends.append(match.end())
+        row.values.append(int(match[0]))
+    for match in SYMBOL_RE.finditer(line):
+        row.symbols.append(match.start())
+        if match[0] == b"*":
+            row.gears.append(match.start())
+    return row
+
+
+def has_symbol(row: Row, first: int, last: int) -> bool:
+    """Whether `row` holds a symbol between columns `first` and `last` included."""
+    i = bisect_left(row.symbols, first)
+    return i < len(row.symbols) and row.symbols[i] <= last
+
+
+def adjacent_numbers(row: Row, col: int) -> list[int]:
+    """Values of the numbers of `row` touching the columns around `col`."""
+    numbers = []
+    # numbers are at least one column apart: no more than 2 fit in 3 columns
+    i = bisect_right(row.starts, col + 1) - 1
+    while i >= 0 and row.ends[i] >= col:
+        numbers.append(row.values[i])
+        i -= 1
+    return numbers
+
+
+def part_numbers(above: Row, row: Row, below: Row) -> Iterator[int]:
+    for start, end, value in zip(row.starts, row.ends, row.values):
+        if any(has_symbol(r, start - 1, end) for r in (above, row, below)):
+            yield value
+
+
+def gear_ratios(above: Row, row: Row, below: Row) -> Iterator[int]:
+    for col in row.gears:
+        numbers = [n for r in (above, row, below) for n in adjacent_numbers(r, col)]
+        if len(numbers) == 2:
+            yield numbers[0] * numbers[1]
+
+
+def stream_schematic(lines: Iterable[bytes]) -> Iterator[tuple[list[int], list[int]]]:
+    """Part numbers and gear ratios of every row, as soon as the row below it is read."""
+    above, row = Row(), None
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        below = parse_row(line)
+        if row is not None:
+            yield list(part_numbers(above, row, below)), list(gear_ratios(above, row, below))
+            above = row
+        row = below
+
+    if row is not None:
+        below = Row()
+        yield list(part_numbers(above, row, below)), list(gear_ratios(above, row, below))
+
+
+def scan_lines(lines: Iterable[bytes]) -> tuple[int, int]:
+    """Sum of the part numbers and sum of the gear ratios."""
+    part_sum = ratio_sum = 0
+    for numbers, ratios in stream_schematic(lines):
+        part_sum += sum(numbers)
+        ratio_sum += sum(ratios)
+    return part_sum, ratio_sum
+
+
+def scan_file(path: Path) -> tuple[int, int]:
+    with open(path, "rb") as f:
+        return scan_lines(f)
+
+
+def tests():
+    schematic = b"""
+        467..114..
+        ...*......
+        ..35..633.
+        ......#...
+        617*......
+        .....+.58.
+        ..592.....
+        ......755.
+        ...$.*....
+        .664.598..
+    """
+    rows = list(stream_schematic(schematic.splitlines()))
+    assert len(rows) == 10
+    assert [n for numbers, _ in rows for n in numbers] == [467, 35, 633, 617, 592, 755, 664, 598]
+    assert [r for _, ratios in rows for r in ratios] == [16345, 451490]
+    assert scan_lines(schematic.splitlines()) == (4361, 467835)
+
+    # equal numbers around a gear are two numbers, in the same row or not
+    assert scan_lines([b"12*12"]) == (24, 144)
+    assert scan_lines([b"7..", b".*.", b"..7"]) == (14, 49)
+    assert scan_lines([b"1.1", b".*.", b"1.."]) == (3, 0)
+    assert adjacent_numbers(parse_row(b"12.34"), 2) == [34, 12]
+    assert scan_lines([]) == (0, 0)
+
+
+if __name__ == "__main__":
+    tests()
+
+    args = build_parser(__doc__, SCRIPT_DIR / "input.txt").parse_args()
+    report(args.path, ("1st answer:", "2nd answer:"), lambda: scan_file(args.path))
@@ -0,0 +1,180 @@
+"""
+Both answers for location lists too large to hold in memory.
+
+Usage:
+
+    python external.py lists.txt --chunk-size 16 --tmp-dir /scratch --fan-in 16
+
+The input is read a chunk of lines at a time. Each chunk's left and right
+columns are sorted and written as packed int64 to temporary files, one sorted
+run per column. The runs of a column are then merged `FAN_IN` at a time into
+longer runs, pass after pass, until no more than `FAN_IN` are left, and these
+are merged back into one sorted stream:
+
+- part 1 walks the two merged columns in lockstep;
+- part 2 merges them again and joins equal values: each value scores
+  value * (count on the left) * (count on the right).
+
+Memory is bounded by the chunk size plus one read block for each of the
+2 * `FAN_IN` runs open at once (the left and right columns are merged side by
+side), however large the input. So are the open files.
+"""
+
+import heapq
+import sys
+import tempfile
+from array import array
+from itertools import groupby, islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.parsing import int_columns
+from aoc.streams import build_parser, read_chunks, report
+
+CHUNK_SIZE = 16 * 1024 * 1024
+# int64 items read at once from every run during the merge
+BLOCK_SIZE = 64 * 1024
+# runs merged at once, per column
+FAN_IN = 16
+
+
+def write_run(values: list[int], path: Path) -> Path:
+    with open(path, "wb") as f:
+        array("q", sorted(values)).tofile(f)
+    return path
+
+
+def write_runs(
+    path: Path, run_dir: Path, chunk_size: int = CHUNK_SIZE
+) -> tuple[list[Path], list[Path]]:
+    """Sorted runs of the left and right columns of every chunk."""
+    left_runs, right_runs = [], []
+    for n, chunk in enumerate(read_chunks(path, chunk_size, b"\n")):
+        left, right = int_columns(chunk, 2)
+        left_runs.append(write_run(left, run_dir / f"left{n}.bin"))
+        right_runs.append(write_run(right, run_dir / f"right{n}.bin"))
+    return left_runs, right_runs
+
+
+def read_run(path: Path, block_size: int = BLOCK_SIZE) -> Iterator[int]:
+    with open(path, "rb") as f:
+        while True:
+            block = array("q")
+            try:
+                block.fromfile(f, block_size)
+            except EOFError:
+                # the last, shorter block is still read
+                yield from block
+                return
+            yield from block
+
+
+def merge_runs(paths: list[Path]) -> Iterator[int]:
+    return heapq.merge(*map(read_run, paths))
+
+
+def write_merged_run(paths: list[Path], path: Path, block_size: int = BLOCK_SIZE) -> Path:
+    """Merges the runs at `paths` into a single run at `path`, and removes them."""
+    merged = merge_runs(paths)
+    with open(path, "wb") as f:
+        while block := array("q", islice(merged, block_size)):
+            block.tofile(f)
+    for run in paths:
+        run.unlink()
+    return path
+
+
+def reduce_runs(paths: list[Path], fan_in: int = FAN_IN) -> list[Path]:
+    """Merges the runs `fan_in` at a time until no more than `fan_in` are left."""
+    while len(paths) > fan_in:
+        groups = [paths[i : i + fan_in] for i in range(0, len(paths), fan_in)]
+        # a lone run at the end is kept as is for the next pass
+        paths = [
+            write_merged_run(group, group[0].with_stem(group[0].stem + "m"))
+            if len(group) > 1 else group[0]
+            for group in groups
+        ]
+    return paths
+
+
+def total_distance(left: Iterable[int], right: Iterable[int]) -> int:
+    """Part 1 over the two sorted columns."""
+    return sum(abs(x - y) for x, y in zip(left, right))
+
+
+def value_counts(values: Iterable[int]) -> Iterator[tuple[int, int]]:
+    return ((value, sum(1 for _ in group)) for value, group in groupby(values))
+
+
+def similarity_score(left: Iterable[int], right: Iterable[int]) -> int:
+    """Part 2 over the two sorted columns, as a merge join of their distinct values."""
+    score = 0
+    right_counts = value_counts(right)
+    right_value, right_count = next(right_counts, (None, 0))
+    for value, count in value_counts(left):
+        while right_value is not None and right_value < value:
+            right_value, right_count = next(right_counts, (None, 0))
+        if right_value is None:
+            break
+        if right_value == value:
+            score += value * count * right_count
+    return score
+
+
+def solve_file(
+    path: Path,
+    chunk_size: int = CHUNK_SIZE,
+    tmp_dir: Optional[Path] = None,
+    fan_in: int = FAN_IN,
+) -> tuple[int, int]:
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir:
+        left_runs, right_runs = write_runs(path, Path(run_dir), chunk_size)
+        left_runs, right_runs = reduce_runs(left_runs, fan_in), reduce_runs(right_runs, fan_in)
+        distance = total_distance(merge_runs(left_runs), merge_runs(right_runs))
+        score = similarity_score(merge_runs(left_runs), merge_runs(right_runs))
+    return distance, score
+
+
+def tests():
+    text = b"3   4\n4   3\n2   5\n1   3\n3   9\n3   3"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "lists.txt"
+        path.write_bytes(text)
+        # from one run per line up to a single run
+        for chunk_size in (1, 7, 13, len(text)):
+            assert b"".join(read_chunks(path, chunk_size, b"\n")) == text
+            assert solve_file(path, chunk_size) == (11, 31)
+
+        # more runs than merged at once: 6 runs per column, then 3, then 2
+        for fan_in in (2, 3):
+            assert solve_file(path, 1, fan_in=fan_in) == (11, 31)
+
+        values = [[5, 1], [4], [], [2, 9], [3, 3], [7]]
+        runs = [write_run(v, Path(tmp) / f"run{n}.bin") for n, v in enumerate(values)]
+        merged = reduce_runs(runs, 2)
+        assert len(merged) == 2 and list(merge_runs(merged)) == [1, 2, 3, 3, 4, 5, 7, 9]
+        assert sorted(p.name for p in Path(tmp).glob("*.bin")) == ["run0mm.bin", "run4m.bin"]
+
+        path.write_bytes(b"")
+        assert solve_file(path) == (0, 0)
+
+    assert list(value_counts([1, 1, 2, 5, 5, 5])) == [(1, 2), (2, 1), (5, 3)]
+    assert similarity_score([1, 7, 7, 9], [3, 7, 7, 7]) == 7 * 2 * 3
+
+
+if __name__ == "__main__":
+    tests()
+
+    parser = build_parser(__doc__, SCRIPT_DIR / "input.txt")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE // 2**20, help="MiB per run")
+    parser.add_argument("--tmp-dir", type=Path, help="where the runs are written")
+    parser.add_argument("--fan-in", type=int, default=FAN_IN, help="runs merged at once")
+    args = parser.parse_args()
+    report(
+        args.path,
+        ("Part 1:", "Part 2:"),
+        lambda: solve_file(args.path, args.chunk_size * 2**20, args.tmp_dir, args.fan_in),
+    )
@@ -0,0 +1,17 @@
+"""
+Synthetic location lists: `size` is the number of rows.
+
+About a third of the right column reuses values of the left one, so the
+similarity score of part 2 is not trivially zero.
+"""
+import random
+
+
+def generate(size: int, seed: int = 0, max_value: int = 99999) -> str:
+    rng = random.Random(seed)
+    left = [rng.randint(10000, max_value) for _ in range(size)]
+    right = [
+        rng.choice(left) if rng.random() < 0.3 else rng.randint(10000, max_value)
+        for _ in range(size)
+    ]
+    return "\n".join(f"{x}   {y}" for x, y in zip(left, right)) + "\n"
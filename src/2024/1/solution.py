@@ -1,31 +1,103 @@
+import sys
 from pathlib import Path
 from collections import Counter
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.days import load_module
+from aoc.parsing import int_array, int_columns
+
+# sorted runs on disk, for lists that don't fit in memory
+external = load_module(SCRIPT_DIR / "external.py")
 
-def load_data():
-    left, right = [], []
+def load_data() -> str:
     with open(SCRIPT_DIR / "input.txt") as f:
-        for line in f:
-            x, *_ , y = line.split(" ")
-            left.append(int(x))
-            right.append(int(y))
+        return f.read()
+
+
+def parse_data(data: str):
+    # the lists are arrays when NumPy is available, see part1/part2
+    if np is None:
+        return parse_lists(data)
+    return parse_arrays(data)
+
+
+def parse_lists(data: str) -> tuple[list[int], list[int]]:
+    left, right = int_columns(data, 2)
     return left, right
 
 
-def part1(left, right):
-    total_diff = sum(abs(x-y) for x, y in zip(sorted(left), sorted(right)))
-    print("Part 1:", total_diff)
+def parse_arrays(data: str) -> tuple["np.ndarray", "np.ndarray"]:
+    values = int_array(data)
+    if len(values) % 2:
+        raise ValueError(f"{len(values)} integers do not fill 2 columns")
+    return values[0::2], values[1::2]
+
+
+def total_distance(left: list[int], right: list[int]) -> int:
+    return sum(abs(x-y) for x, y in zip(sorted(left), sorted(right)))
+
 
+def total_distance_arrays(left: "np.ndarray", right: "np.ndarray") -> int:
+    return int(np.abs(np.sort(left) - np.sort(right)).sum())
 
-def part2(left, right):
+
+def similarity_score(left: list[int], right: list[int]) -> int:
     right_counts = Counter(right)
-    similarity_score = sum(x * right_counts[x] for x in left)
-    print("Part 2:", similarity_score)
+    return sum(x * right_counts[x] for x in left)
+
+
+def similarity_score_arrays(left: "np.ndarray", right: "np.ndarray") -> int:
+    values, counts = np.unique(right, return_counts=True)
+    # where each left value would be among the right ones, if it is there at all
+    idx = np.minimum(np.searchsorted(values, left), len(values) - 1)
+    found = values[idx] == left if len(values) else np.zeros(len(left), dtype=bool)
+    return int((left[found] * counts[idx[found]]).sum())
+
+
+def part1(left, right) -> int:
+    if np is None:
+        return total_distance(left, right)
+    return total_distance_arrays(left, right)
+
+
+def part2(left, right) -> int:
+    if np is None:
+        return similarity_score(left, right)
+    return similarity_score_arrays(left, right)
+
+
+def tests():
+    raw_data = """
+    3   4
+    4   3
+    2   5
+    1   3
+    3   9
+    3   3
+    """
+    left, right = parse_data(raw_data)
+    assert part1(left, right) == 11
+    assert part2(left, right) == 31
 
+    left, right = parse_lists(raw_data)
+    assert total_distance(left, right) == 11
+    assert similarity_score(left, right) == 31
+    if np is not None:
+        assert similarity_score_arrays(np.array([1, 2]), np.zeros(0, dtype=np.int64)) == 0
+        assert similarity_score_arrays(np.array([1, 7]), np.array([7, 3, 7])) == 14
+    external.tests()
 
-left, right = load_data()
-part1(left, right)
-part2(left, right)
 
+if __name__ == "__main__":
+    tests()
 
+    left, right = parse_data(load_data())
+    print("Part 1:", part1(left, right))
+    print("Part 2:", part2(left, right))
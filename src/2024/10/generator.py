@@ -0,0 +1,27 @@
+"""
+Synthetic topographic maps: `size` is the side of the (square) map.
+
+Random heights would almost never contain a hiking trail, so on top of random
+noise, trails are drawn as random walks going up from 0 to 9.
+"""
+import random
+
+DIRECTIONS = [(-1, 0), (0, -1), (1, 0), (0, 1)]
+
+
+def generate(size: int, seed: int = 0, trail_density: float = 0.05) -> str:
+    rng = random.Random(seed)
+    grid = [[rng.randrange(10) for _ in range(size)] for _ in range(size)]
+
+    for _ in range(int(size * size * trail_density) + 1):
+        i, j = rng.randrange(size), rng.randrange(size)
+        for height in range(10):
+            grid[i][j] = height
+            moves = [
+                (i + di, j + dj)
+                for di, dj in DIRECTIONS
+                if 0 <= i + di < size and 0 <= j + dj < size
+            ]
+            i, j = rng.choice(moves)
+
+    return "\n".join("".join(map(str, row)) for row in grid) + "\n"
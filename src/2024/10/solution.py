@@ -1,10 +1,20 @@
+import sys
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterator
 
 SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
 
-Map = list[list[int]]
-Position = tuple[int, int]
+from aoc import metrics
+from aoc.grid import Grid
+
+# heights are kept as their ASCII digits, the zero byte border never equals a
+# height + 1 so walks stop at the edge without bounds checks
+Map = Grid
+Position = int
+
+TRAILHEAD = b"0"
+SUMMIT = ord("9")
 
 
 def load_data() -> str:
@@ -14,7 +24,7 @@ def load_data() -> str:
 
 
 def parse_data(data: str) -> Map:
-    return [[int(x) for x in line.strip()] for line in data.strip().splitlines()]
+    return Grid.from_text(data)
 
 
 def part1(data: Map) -> int:
@@ -22,37 +32,23 @@ def part1(data: Map) -> int:
 
 
 def trailhead_gen(data: Map) -> Iterator[Position]:
-    for i, row in enumerate(data):
-        for j, height in enumerate(row):
-            if height == 0:
-                yield (i, j)
-
-
-def trailhead_score(
-    data: Map, curr: Position, visited: Optional[set[Position]] = None
-) -> int:
-    i, j = curr
-    curr_height = data[i][j]
-    visited = visited or set()
-    visited.add(curr)
-
-    if curr_height == 9:
-        return 1
+    return data.find(TRAILHEAD)
 
-    score = 0
-    for n, m in neighbours_gen(data, curr):
-        if (data[n][m] == curr_height + 1) and ((n, m) not in visited):
-            score += trailhead_score(data, (n, m), visited)
 
-    return score
+def trailhead_score(data: Map, curr: Position) -> int:
+    # walks up one height at a time, keeping the distinct cells reached
+    cells, offsets = data.cells, data.offsets4
+    height = cells[curr]
+    reached = {curr}
+    visited = 1
+    while height != SUMMIT and reached:
+        height += 1
+        reached = {pos + o for pos in reached for o in offsets if cells[pos + o] == height}
+        visited += len(reached)
 
-
-def neighbours_gen(data: Map, pos: Position) -> Iterator[Position]:
-    i, j = pos
-    neighbours = [(i - 1, j), (i, j - 1), (i + 1, j), (i, j + 1)]
-    for n, m in neighbours:
-        if (0 <= n < len(data)) and (0 <= m < len(data[0])):
-            yield (n, m)
+    if metrics.enabled:
+        metrics.incr("trailhead_score.visited", visited)
+    return len(reached)
 
 
 def part2(data) -> int:
@@ -60,18 +56,27 @@ def part2(data) -> int:
 
 
 def trailhead_rating(data: Map, curr: Position) -> int:
-    i, j = curr
-    curr_height = data[i][j]
-
-    if curr_height == 9:
-        return 1
-
-    score = 0
-    for n, m in neighbours_gen(data, curr):
-        if data[n][m] == curr_height + 1:
-            score += trailhead_rating(data, (n, m))
-
-    return score
+    # every path is walked on its own, so a cell is pushed once per path to it
+    cells, offsets = data.cells, data.offsets4
+    stack = [curr]
+    rating = 0
+    visited = 0
+    while stack:
+        pos = stack.pop()
+        visited += 1
+        height = cells[pos]
+        if height == SUMMIT:
+            rating += 1
+            continue
+
+        height += 1
+        for o in offsets:
+            if cells[pos + o] == height:
+                stack.append(pos + o)
+
+    if metrics.enabled:
+        metrics.incr("trailhead_rating.visited", visited)
+    return rating
 
 
 def tests():
@@ -0,0 +1,10 @@
+"""
+Synthetic stone lines: `size` is the number of stones.
+"""
+import random
+
+
+def generate(size: int, seed: int = 0, max_digits: int = 7) -> str:
+    rng = random.Random(seed)
+    stones = [rng.randrange(10 ** rng.randint(1, max_digits)) for _ in range(size)]
+    return " ".join(map(str, stones)) + "\n"
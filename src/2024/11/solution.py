@@ -1,7 +1,12 @@
+import sys
+from collections import Counter, defaultdict
 from functools import cache
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc import metrics
 
 
 def load_data() -> str:
@@ -15,29 +20,48 @@ def parse_data(data: str) -> list[int]:
 
 
 @cache
-def count_stones(stone: int, n: int) -> int:
-    if n <= 0:
-        return 1
-
+def change_stone(stone: int) -> tuple[int, ...]:
+    """The stones `stone` turns into after one blink."""
     if stone == 0:
-        return count_stones(1, n - 1)
-
-    elif len(str(stone)) % 2 == 0:
-        stone_str = str(stone)
-        idx = len(str(stone)) // 2
-        return count_stones(int(stone_str[:idx]), n - 1) + count_stones(
-            int(stone_str[idx:]), n - 1
-        )
+        return (1,)
+
+    stone_str = str(stone)
+    if len(stone_str) % 2 == 0:
+        idx = len(stone_str) // 2
+        return (int(stone_str[:idx]), int(stone_str[idx:]))
     else:
-        return count_stones(2024 * stone, n - 1)
+        return (2024 * stone,)
+
+
+def count_stones(stone: int, n: int) -> int:
+    return blink([stone], n)
+
+
+def blink(stones: list[int], n: int) -> int:
+    # the order of the stones never matters, only how many of each there are
+    before = change_stone.cache_info() if metrics.enabled else None
+    counts = Counter(stones)
+    for _ in range(n):
+        next_counts: dict[int, int] = defaultdict(int)
+        for stone, count in counts.items():
+            for new_stone in change_stone(stone):
+                next_counts[new_stone] += count
+        counts = next_counts
+    total = sum(counts.values())
+
+    if metrics.enabled:
+        after = change_stone.cache_info()
+        metrics.incr("change_stone.memo_hits", after.hits - before.hits)
+        metrics.incr("change_stone.memo_misses", after.misses - before.misses)
+    return total
 
 
 def part1(stones: list[int]) -> int:
-    return sum(count_stones(s, n=25) for s in stones)
+    return blink(stones, n=25)
 
 
 def part2(stones: list[int]) -> int:
-    return sum(count_stones(s, n=75) for s in stones)
+    return blink(stones, n=75)
 
 
 def tests():
@@ -45,6 +69,8 @@ def tests():
     stones = parse_data(raw_data)
 
     assert part1(stones) == 55312
+    # deeper than the recursion limit
+    assert count_stones(0, 2_000) > 0
 
 
 if __name__ == "__main__":
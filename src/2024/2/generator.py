@@ -0,0 +1,25 @@
+"""
+Synthetic reactor reports: `size` is the number of reports.
+
+Reports start out safe (monotonic with steps of 1 to 3) and then get zero, one
+or two levels disturbed, so all of safe, dampened-safe and unsafe show up.
+"""
+import random
+
+
+def generate_report(rng: random.Random, min_len: int, max_len: int) -> list[int]:
+    sign = rng.choice([-1, 1])
+    report = [rng.randint(20, 80)]
+    for _ in range(rng.randint(min_len, max_len) - 1):
+        report.append(report[-1] + sign * rng.randint(1, 3))
+
+    for _ in range(rng.choice([0, 0, 1, 1, 2])):
+        idx = rng.randrange(len(report))
+        report[idx] += rng.choice([-4, -1, 0, 1, 4])
+    return report
+
+
+def generate(size: int, seed: int = 0, min_len: int = 5, max_len: int = 8) -> str:
+    rng = random.Random(seed)
+    reports = [generate_report(rng, min_len, max_len) for _ in range(size)]
+    return "\n".join(" ".join(map(str, report)) for report in reports) + "\n"
@@ -1,14 +1,29 @@
+import json
+import sys
 from pathlib import Path
 from collections import Counter
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
 
-def load_data() -> list[list[int]]:
+from aoc.parsing import int_lists, int_rows_array
+
+def load_data() -> str:
     with open(SCRIPT_DIR / "input.txt") as f:
-        data = [[int(x) for x in line.split(" ")] for line in f]
-        return data
+        return f.read()
+
+
+def parse_data(data: str) -> list[list[int]]:
+    return int_lists(data)
 
 def is_report_safe(report: list[int]) -> bool:
+    if len(report) < 2:
+        return True
     try:
         sign = (report[1] - report[0]) / abs(report[1] - report[0])
     except ZeroDivisionError:
@@ -22,85 +37,39 @@ def is_report_safe(report: list[int]) -> bool:
     return True
 
     
-def part1(data: list[list[int]]):
-    print("Part 1:", sum(is_report_safe(report) for report in data))
+def part1(data: list[list[int]]) -> int:
+    return sum(is_report_safe(report) for report in data)
 
 
-def is_report_safe2(report: list[int], can_remove: bool = True) -> bool:
-    try:
-        sign = (report[1] - report[0]) / abs(report[1] - report[0])
-    except ZeroDivisionError:
-        if can_remove:
-            return is_report_safe2(report[1:], can_remove=False)
-        else:
-            return False
+def first_unsafe_step(report: list[int], sign: int) -> int:
+    """Index i of the first pair of levels (i, i + 1) breaking the rules, -1 if there is none."""
+    for i in range(len(report) - 1):
+        if not 1 <= (report[i + 1] - report[i]) * sign <= 3:
+            return i
+    return -1
 
-    allowed = {sign * x for x in range(1, 4)}
-    for idx, (x, y) in enumerate(zip(report, report[1:])):
-        if y - x not in allowed:
-            if can_remove:
-                new_report = report[:idx] + report[idx+1:]
-                return is_report_safe2(new_report, can_remove=False)
-            else:
-                return False
-        
-    return True
 
-def get_sign(report: list[int]) -> int:
-    diffs = [y-x for x, y in zip(report, report[1:])]
-    increasing = sum(x for x in diffs if x > 0)
-    zeros = sum(x for x in diffs if x==0)
-    decreasing = len(diffs) - increasing - zeros
-    max_count = max(zeros, increasing, decreasing)
-    if (zeros >= 2) or (zeros == max_count):
-        return 0 
-    if increasing == max_count:
-        return 1
-    elif decreasing == max_count:
-        return -1
-
-
-def is_report_safe3(report: list[int]) -> bool:
-    """
-    can_remove = True
-
-    if report[0] != report[1]:
-        first_idx = 0
-    else:
-        if report[2] == report[1]:
-            return False 
-        first_idx = 1
-        can_remove = False
-    
-    diff = report[first_idx + 1] - report[first_idx]
-    sign = diff / abs(diff)
-    """
-    can_remove = True
-    sign = get_sign(report)
+def is_safe_without(report: list[int], sign: int, skip: int) -> bool:
+    """Whether the report is safe once the level at `skip` is removed, without copying it."""
+    prev = None
+    for i, level in enumerate(report):
+        if i == skip:
+            continue
+        if prev is not None and not 1 <= (level - prev) * sign <= 3:
+            return False
+        prev = level
+    return True
 
-    allowed = {sign * x for x in range(1, 4)}
-    #for idx, (x, y) in enumerate(zip(report[first_idx:], report[first_idx+1:])):
-    for idx, (x, y) in enumerate(zip(report[:], report[1:])):
-        if y - x not in allowed:
-            if can_remove:
-                if idx == 0
-                """
-                try:
-                    if report[idx + 2] - x not in allowed:
-                        return False
-                except IndexError:
-                    return True
-                """
-            else:
-                return False
-            can_remove = False
 
-    return True
+def is_report_safe_dampened(report: list[int]) -> bool:
+    # a removal anywhere else leaves the first unsafe pair side by side, so
+    # only its two levels are worth removing: at most 3 passes per direction
+    for sign in (1, -1):
+        i = first_unsafe_step(report, sign)
+        if i == -1 or is_safe_without(report, sign, i) or is_safe_without(report, sign, i + 1):
+            return True
+    return False
 
-def is_report_safe4(report):
-    diffs = [y-x for x, y in zip(report, report[1:])]
-    if diffs.count(0) >= 3:
-        return False
 
 def is_report_safe_brute_force(report):
     for i in range(0, len(report)):
@@ -109,35 +78,91 @@ def is_report_safe_brute_force(report):
             return True
     return False
 
-def part2(data):
-    print("Part 2:", sum(is_report_safe_brute_force(report) for report in data))
+def part2(data: list[list[int]]) -> int:
+    return sum(is_report_safe_dampened(report) for report in data)
 
 
-data = load_data() 
-part1(data)
-part2(data)
+# ---------- batched ----------
 
-import json
 
-"""
-tests = [[report, is_report_safe_brute_force(report)] for report in data]
-with open(SCRIPT_DIR/"tests.json", "w") as f:
-    json.dump(tests, f, indent=4)
-"""
-with open(SCRIPT_DIR/"tests.json", "r") as f:
-    tests = json.load(f)
+def parse_arrays(data: str) -> tuple["np.ndarray", "np.ndarray"]:
+    """All the levels flat, report i is values[offsets[i]:offsets[i + 1]]."""
+    return int_rows_array(data)
 
 
-for i, (report, expected) in enumerate(tests):
-    res = is_report_safe3(report)
-    diffs = [y-x for x, y in zip(report, report[1:])]
-    if res != expected:
-        print(f"{i} - {report}, expected: {expected}, diffs: {diffs}")
+def _steps_ok(steps: "np.ndarray", sign: int) -> "np.ndarray":
+    return (1 <= steps * sign) & (steps * sign <= 3)
 
 
-"""
-for report in data[:20]:
-    diffs = [y-x for x, y in zip(report, report[1:])]
-    print(f"\t({report}, {is_report_safe3(report)}),")
-    #print(report, diffs, is_report_safe3(report))
-"""
\ No newline at end of file
+def classify_reports(values: "np.ndarray", offsets: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Safe and dampened safe masks of every report, from the steps of all the
+    reports computed at once. Removing level k drops the steps on both sides of
+    it and joins its neighbors with a new step: the report is then safe when
+    its only unsafe steps were those around k and the new step is fine.
+    """
+    nreports = len(offsets) - 1
+    report_of = np.repeat(np.arange(nreports), np.diff(offsets))
+    # step j goes from level j to j + 1, the one crossing two reports is ignored
+    steps = np.diff(values)
+    inner = report_of[1:] == report_of[:-1]
+    # the step replacing level k, for k with neighbors on both sides
+    joined = values[2:] - values[:-2]
+    joined_inner = report_of[2:] == report_of[:-2]
+
+    safe = np.zeros(nreports, dtype=bool)
+    dampened = np.zeros(nreports, dtype=bool)
+    for sign in (1, -1):
+        unsafe = inner & ~_steps_ok(steps, sign)
+        unsafe_counts = np.bincount(report_of[:-1][unsafe], minlength=nreports)
+        safe |= unsafe_counts == 0
+
+        remaining = unsafe_counts[report_of]
+        remaining[1:] -= unsafe
+        remaining[:-1] -= unsafe
+        joined_ok = np.ones(len(values), dtype=bool)
+        joined_ok[1:-1] = ~joined_inner | _steps_ok(joined, sign)
+        fits = (remaining == 0) & joined_ok
+        dampened |= np.bincount(report_of[fits], minlength=nreports) > 0
+    return safe, dampened
+
+
+def tests():
+    raw_data = """
+    7 6 4 2 1
+    1 2 7 8 9
+    9 7 6 2 1
+    1 3 2 4 5
+    8 6 4 4 1
+    1 3 6 7 9
+    """
+    data = parse_data(raw_data)
+    assert part1(data) == 2
+    assert part2(data) == 4
+
+    with open(SCRIPT_DIR/"tests.json", "r") as f:
+        reports = json.load(f)
+    for report, expected in reports:
+        assert is_report_safe_brute_force(report) == expected
+        assert is_report_safe_dampened(report) == expected
+    assert is_report_safe_dampened([5, 1, 2, 3]) and is_report_safe_dampened([1, 2, 3, 3])
+    assert not is_report_safe_dampened([1, 1, 1, 2])
+
+    if np is not None:
+        values, offsets = parse_arrays(raw_data)
+        safe, dampened = classify_reports(values, offsets)
+        assert safe.tolist() == [is_report_safe(report) for report in data]
+        assert dampened.tolist() == [is_report_safe_dampened(report) for report in data]
+        levels = [report for report, _ in reports] + [[4], [1, 9], [5, 1, 2, 3]]
+        values = np.array([level for report in levels for level in report])
+        offsets = np.cumsum([0] + [len(report) for report in levels])
+        expected = [expected for _, expected in reports] + [True, True, True]
+        assert classify_reports(values, offsets)[1].tolist() == expected
+
+
+if __name__ == "__main__":
+    tests()
+
+    data = parse_data(load_data())
+    print("Part 1:", part1(data))
+    print("Part 2:", part2(data))
@@ -0,0 +1,44 @@
+"""
+Synthetic corrupted memory: `size` is the (approximate) number of characters.
+
+Valid `mul(X,Y)` instructions, `do()`/`don't()` switches and near misses such
+as `mul(4*`, `mul ( 2 , 4 )` or `mul[3,7]` are separated by random noise.
+"""
+import random
+
+NOISE = "!@#$%^&*()[]{}<>?/\\'+-_:;, whyselectfromwhenhow"
+NEAR_MISSES = [
+    "mul(4*",
+    "mul(6,9!",
+    "?(12,34)",
+    "mul ( 2 , 4 )",
+    "mul[3,7]",
+    "mul(32,64]",
+    "do_not_mul(5,5",
+    "don't",
+    "do(",
+]
+
+
+def generate_token(rng: random.Random) -> str:
+    draw = rng.random()
+    if draw < 0.45:
+        return f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+    if draw < 0.5:
+        return "do()"
+    if draw < 0.55:
+        return "don't()"
+    if draw < 0.7:
+        return rng.choice(NEAR_MISSES)
+    return "".join(rng.choices(NOISE, k=rng.randint(1, 8)))
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    tokens = []
+    length = 0
+    while length < size:
+        token = generate_token(rng)
+        tokens.append(token)
+        length += len(token)
+    return "".join(tokens) + "\n"
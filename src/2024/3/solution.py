@@ -1,70 +1,39 @@
-import re
+import sys
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.days import load_module
+
+tokenizer = load_module(SCRIPT_DIR / "tokenizer.py")
 
 def load_data() -> str:
     with open(SCRIPT_DIR / "input.txt") as f:
         return f.read()
 
 
-def parse_and_sum_muls(data: str) -> int:
-    muls = []
-    for pair in re.findall(r"mul\((\d+,\d+)\)", data):
-        x, y = map(int, pair.split(","))
-        muls.append(x*y)
-    return sum(muls)
-
-
-def part1(data: str):
-    print("Part 1:", parse_and_sum_muls(data))
-
-
-def part2(data: str):
-    
-    result = 0
-    # split the string on '' characters that follow 'do()' or 'don't()'
-    for substr in re.split(r"(?=do\(\)|don't\(\))\s*", data):
-        if not substr.startswith("don't()"):
-            result += parse_and_sum_muls(substr)
-
-    print("Part 2:", result)
-
-"""
-def try_parse_mul(data: str, i: int):
-    length = len(data)
+def part1(data: str) -> int:
+    return tokenizer.scan([data.encode()])[0]
 
-    if data[i:i+4] == "mul(":
-        i += 4
-        x, y = "", ""
-        while i < length and data[i].isdigit():
-            x += data[i]
-            i += 1
-        if i < length and data[i] == ",":
-            i += 1
-        else: 
-            return None, i
-        while i < length and data[i].isdigit():
-            y += data[i]
-            i += 1
-        if i < length and data[i] == ")":
-            i += 1
-        else:
-            return None, i
 
-def part1_no_regex(data: str):
-    i = 0
-    length = len(data)
+def part2(data: str) -> int:
+    # the muls are summed with a running do()/don't() flag, see tokenizer.py
+    return tokenizer.scan([data.encode()])[1]
 
-    while i < length:
-        pass
-"""        
-            
 
-data = load_data()
-part1(data)
-part2(data)
+def tests():
+    raw_data = "xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)+mul(32,64]then(mul(11,8)mul(8,5))"
+    assert part1(raw_data) == 161
 
+    raw_data = "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
+    assert part2(raw_data) == 48
+    tokenizer.tests()
 
 
+if __name__ == "__main__":
+    tests()
 
+    data = load_data()
+    print("Part 1:", part1(data))
+    print("Part 2:", part2(data))
@@ -0,0 +1,248 @@
+"""
+Both answers in one pass over the corrupted memory, a buffer at a time.
+
+Usage:
+
+    python tokenizer.py memory.txt --buffer-size 1
+    python tokenizer.py memory.txt -j 8 --chunk-size 64
+
+The tokens (`mul(X,Y)`, `do()` and `don't()`) are matched in each buffer by
+a single regex, and a `Scanner` carries what has to survive from one buffer to
+the next:
+
+- whether the muls are enabled, the last `do()`/`don't()` seen;
+- the start of a token cut by the end of the buffer, put back in front of the
+  next one. Only `m` and `d` can start a token and neither shows up further in
+  one, so a cut token can only start at the last of them.
+
+Memory is bounded by the buffer size (plus the longest token), not the file.
+
+With several jobs the file is cut into byte ranges scanned by a process pool.
+A worker can't know whether the muls are enabled when its range starts, so it
+returns its sum for both cases and the last `do()`/`don't()` it saw. The
+tokens cut by the range edges are handed back as well: the head of the range
+(until its first `m` or `d`, no token goes on past one) and the partial token
+at its end. Going through the ranges in order, each tail is joined to the next
+head and scanned with the running flag, which picks the right sum of the next
+range: the result is exactly the sequential one.
+"""
+
+import mmap
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Iterable, Optional
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.streams import build_parser, chunk_bounds, read_chunks, report
+
+# every branch starts with a literal, which lets the regex engine skip ahead to
+# the next "m" or "d"
+TOKEN_RE = re.compile(rb"mul\((\d+),(\d+)\)|do(n't)?\(\)")
+# what is left of a token cut by the end of the buffer
+PARTIAL_TOKEN_RE = re.compile(
+    rb"m(?:u(?:l(?:\((?:\d+(?:,\d*)?)?)?)?)?|d(?:o(?:\(|n(?:'(?:t\(?)?)?)?)?"
+)
+
+# the bytes found in a token after its first one
+TOKEN_TAIL_BYTES = frozenset(b"ul(),0123456789on't")
+
+BUFFER_SIZE = 1024 * 1024
+CHUNK_SIZE = 64 * 1024 * 1024
+
+
+class Scanner:
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.carry = b""
+        self.total = 0
+        self.enabled_total = 0
+
+    def feed(self, buffer: bytes) -> None:
+        data = self.carry + buffer if self.carry else buffer
+        cut = partial_token_start(data)
+        self.carry = data[cut:]
+
+        total = enabled_total = 0
+        enabled = self.enabled
+        for x, y, dont in TOKEN_RE.findall(data, 0, cut):
+            if x:
+                product = int(x) * int(y)
+                total += product
+                if enabled:
+                    enabled_total += product
+            else:
+                enabled = not dont
+        self.enabled = enabled
+        self.total += total
+        self.enabled_total += enabled_total
+
+    def finish(self) -> tuple[int, int]:
+        """Part 1 and part 2 sums, once every buffer has been fed."""
+        # the carry is an unfinished token, that never counts
+        self.carry = b""
+        return self.total, self.enabled_total
+
+
+def partial_token_start(data: bytes) -> int:
+    """Where the token cut by the end of `data` starts, `len(data)` if there is none."""
+    start = max(data.rfind(b"m"), data.rfind(b"d"))
+    if start != -1 and PARTIAL_TOKEN_RE.fullmatch(data, start):
+        return start
+    return len(data)
+
+
+def scan(buffers: Iterable[bytes]) -> tuple[int, int]:
+    scanner = Scanner()
+    for buffer in buffers:
+        scanner.feed(buffer)
+    return scanner.finish()
+
+
+def scan_file(path: Path, buffer_size: int = BUFFER_SIZE) -> tuple[int, int]:
+    return scan(read_chunks(path, buffer_size))
+
+
+# ---------- parallel ----------
+
+
+@dataclass(slots=True)
+class Chunk:
+    """What the scan of a byte range hands back to be stitched with its neighbors."""
+    head: bytes
+    tail: bytes
+    # whether the range is only made of its head
+    empty: bool
+    total: int = 0
+    # enabled sums, depending on the flag at the start of the range
+    enabled_total: int = 0
+    disabled_total: int = 0
+    # the last do() (True) or don't() (False) of the range
+    last: Optional[bool] = None
+
+
+def head_end(data: bytes) -> int:
+    """Where the leftover of a token cut by the start of `data` may end at the latest."""
+    for i, c in enumerate(data):
+        if c not in TOKEN_TAIL_BYTES:
+            return i
+    return len(data)
+
+
+def scan_chunk(data: bytes) -> Chunk:
+    start = head_end(data)
+    if start == len(data):
+        return Chunk(data, b"", True)
+    cut = partial_token_start(data)
+    chunk = Chunk(data[:start], data[cut:], False)
+
+    # products before the first do()/don't() count depending on the start
+    before = after = total = 0
+    last = None
+    for x, y, dont in TOKEN_RE.findall(data, start, cut):
+        if x:
+            product = int(x) * int(y)
+            total += product
+            if last is None:
+                before += product
+            elif last:
+                after += product
+        else:
+            last = not dont
+    chunk.total = total
+    chunk.enabled_total = before + after
+    chunk.disabled_total = after
+    chunk.last = last
+    return chunk
+
+
+def stitch(chunks: Iterable[Chunk]) -> tuple[int, int]:
+    """Sums of the chunks of the whole memory, in order."""
+    total = enabled_total = 0
+    enabled = True
+    pending = b""
+    for chunk in chunks:
+        pending += chunk.head
+        if chunk.empty:
+            continue
+
+        # the tokens cut between the previous range and this one
+        scanner = Scanner(enabled)
+        scanner.feed(pending)
+        joined_total, joined_enabled_total = scanner.finish()
+        enabled = scanner.enabled
+
+        total += joined_total + chunk.total
+        enabled_total += joined_enabled_total
+        enabled_total += chunk.enabled_total if enabled else chunk.disabled_total
+        if chunk.last is not None:
+            enabled = chunk.last
+        pending = chunk.tail
+
+    scanner = Scanner(enabled)
+    scanner.feed(pending)
+    joined_total, joined_enabled_total = scanner.finish()
+    return total + joined_total, enabled_total + joined_enabled_total
+
+
+def _scan_range(path: Path, start: int, end: int) -> Chunk:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        return scan_chunk(buffer[start:end])
+
+
+def scan_file_parallel(
+    path: Path, chunk_size: int = CHUNK_SIZE, jobs: Optional[int] = None
+) -> tuple[int, int]:
+    """Same as `scan_file`, over `jobs` processes."""
+    if os.path.getsize(path) == 0:
+        return 0, 0
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        starts, ends = zip(*chunk_bounds(buffer, chunk_size))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return stitch(executor.map(_scan_range, repeat(path), starts, ends))
+
+
+def tests():
+    data = b"xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
+    assert scan([data]) == (161, 48)
+    # every way to cut the memory in two, or byte by byte
+    for i in range(len(data) + 1):
+        assert scan([data[:i], data[i:]]) == (161, 48)
+    assert scan([data[i : i + 1] for i in range(len(data))]) == (161, 48)
+
+    assert partial_token_start(b"xmul(12,") == 1
+    assert partial_token_start(b"xdon't()") == 8
+    assert partial_token_start(b"mul(1,2)") == 8
+    assert scan([b"mul(1,2", b"3)don", b"'t()mul(2,2)do", b"()mul(1,1)"]) == (28, 24)
+    assert scan([b"mul(2,2"]) == (0, 0)
+
+    # any cut into ranges gives the sequential result
+    memory = data + b"do()mul(1,1)don't()mul(2,222)mul(3,3)do()mul(4,4)do(don't()mul(9,9"
+    expected = scan([memory])
+    for chunk_size in range(1, 20):
+        bounds = chunk_bounds(memory, chunk_size)
+        assert stitch(scan_chunk(memory[start:end]) for start, end in bounds) == expected
+    assert head_end(b"1,2)mul") == 4 and scan_chunk(b",12)").empty
+
+
+if __name__ == "__main__":
+    tests()
+
+    parser = build_parser(__doc__, SCRIPT_DIR / "input.txt")
+    parser.add_argument("--buffer-size", type=int, default=BUFFER_SIZE // 2**20, help="MiB per read")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE // 2**20, help="MiB per job")
+    args = parser.parse_args()
+
+    def solve() -> tuple[int, int]:
+        if args.jobs == 1:
+            return scan_file(args.path, args.buffer_size * 2**20)
+        return scan_file_parallel(args.path, args.chunk_size * 2**20, args.jobs)
+
+    report(args.path, ("Part 1:", "Part 2:"), solve)
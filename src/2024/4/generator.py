@@ -0,0 +1,9 @@
+"""
+Synthetic word searches: `size` is the side of the (square) grid of X/M/A/S.
+"""
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "\n".join("".join(rng.choices("XMAS", k=size)) for _ in range(size)) + "\n"
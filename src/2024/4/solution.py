@@ -1,96 +1,140 @@
+import sys
 from pathlib import Path
-from enum import Enum
+from typing import Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.grid import Grid
+
+WORD = b"XMAS"
+
 
-def load_data() -> list[list[str]]:
+def load_data() -> str:
     with open(SCRIPT_DIR / "input.txt") as f:
-        data = [[x for x in line] for line in f]
-    return data
-
-class Directions(Enum):
-    N = (-1, 0)  
-    S = (1, 0)   
-    E = (0, 1)   
-    W = (0, -1)  
-    NE = (-1, 1) 
-    NW = (-1, -1) 
-    SE = (1, 1)  
-    SW = (1, -1) 
-
-    def move(self, start: tuple[int, int], steps: int = 1) -> tuple[int, int]:
-        y0, x0 = start
-        dy, dx = self.value
-        return (y0 + steps * dy, x0 + steps * dx)
-
-
-def search_word_rec(data: list[list[str]], word: str, start: tuple[int, int], directions: Directions) -> int:
-    if word == "":
-        return 1
-    
-    y1, x1 = start
-
-    if not (0 <= y1 < len(data)) or not (0 <= x1 < len(data[0])):
-        return 0
-    
-    y2, x2 = directions.move(start, steps=1)
+        return f.read()
 
-    if data[y1][x1] == word[0]:
-        return search_word_rec(data, word[1:], (y2, x2), directions)
-    else:
-        return 0
 
+def parse_data(data: str) -> Grid:
+    # a border as wide as the word lets searches run off the grid without checks
+    return Grid.from_text(data, pad=len(WORD) - 1)
 
-def search_word(data: list[list[str]], word: str, start: tuple[int, int], direction: Directions) -> int:
-    yf, xf = direction.move(start, steps=len(word)-1)
-    
-    if not (0 <= yf < len(data)) or not (0 <= xf < len(data[0])):
-        return 0
-    
-    for i, c in enumerate(word):
-        y, x = direction.move(start, steps=i)
-        if data[y][x] != c:
+
+def search_word(data: Grid, word: bytes, start: int, step: int) -> int:
+    cells = data.cells
+    pos = start
+    for c in word:
+        if cells[pos] != c:
             return 0
+        pos += step
     return 1
 
 
-def get_word(data: list[list[str]], start: tuple[int, int], direction: Directions, size: int) -> str:
-    yf, xf = direction.move(start, steps=size-1)
-    word = []
-    for i in range(size):
-        y, x = direction.move(start, steps=i)
-        word.append(data[y][x])
-    return "".join(word)
+def get_word(data: Grid, start: int, step: int, size: int) -> bytes:
+    cells = data.cells
+    return bytes(cells[start + i * step] for i in range(size))
 
-    
-def part1(data: list[list[str]]) -> int:
+
+def count_word(data: Grid, word: bytes) -> int:
     matches = 0
-    for i, row in enumerate(data):
-        for j, char in enumerate(row):
-            if char == "X":
-                for d in Directions:
-                    matches += search_word(data, "XMAS", (i, j), d)
+    for idx in data.find(word[:1]):
+        for step in data.offsets8:
+            matches += search_word(data, word, idx, step)
     return matches
 
 
-def is_xmas_puzzle(data, center: tuple[int, int]):
-    pos1 = Directions.NE.move(center, steps=1)
-    word1 = get_word(data, pos1, Directions.SW, size=3)
-    if word1 not in ("MAS", "SAM"):
+def part1(data: Grid) -> int:
+    if np is None:
+        return count_word(data, WORD)
+    return count_word_array(data, WORD)
+
+
+def is_xmas_puzzle(data: Grid, center: int) -> int:
+    north, north_east, _, south_east, south, south_west, _, north_west = data.offsets8
+
+    word1 = get_word(data, center + north_east, south_west, size=3)
+    if word1 not in (b"MAS", b"SAM"):
         return 0
-    
-    pos2 = Directions.NW.move(center, steps=1)
-    word2 = get_word(data, pos2, Directions.SE, size=3)
-    if word2 not in ("MAS", "SAM"):
+
+    word2 = get_word(data, center + north_west, south_east, size=3)
+    if word2 not in (b"MAS", b"SAM"):
         return 0
     return 1
 
-def part2(data: list[list[str]]) -> int:
+
+def count_xmas(data: Grid) -> int:
+    # 'A's on the edges can't be the center of a cross, their missing
+    # corners are border cells that never match
+    return sum(is_xmas_puzzle(data, idx) for idx in data.find(b"A"))
+
+
+def part2(data: Grid) -> int:
+    if np is None:
+        return count_xmas(data)
+    return count_xmas_array(data)
+
+
+# ---------- NumPy ----------
+
+# cells handled at once, small enough for the masks of a block to stay in cache
+# while it is searched in every direction
+BLOCK_SIZE = 256 * 1024
+
+
+def _letter_masks(data: Grid, letters: bytes) -> dict[int, "np.ndarray"]:
+    cells = np.frombuffer(data.cells, dtype=np.uint8)
+    return {c: cells == c for c in set(letters)}
+
+
+def _blocks(data: Grid) -> Iterator[tuple[int, int]]:
+    """Flat slices covering every row of the grid, its borders on the sides included."""
+    start = data.index(0, 0)
+    end = data.index(data.nrows - 1, data.ncols - 1) + 1
+    for lo in range(start, end, BLOCK_SIZE):
+        yield lo, min(lo + BLOCK_SIZE, end)
+
+
+def count_word_array(data: Grid, word: bytes) -> int:
+    """
+    Same as `count_word` over blocks of cells at once: the cells holding each
+    letter of the word are masks over the flat cells, and the word is in
+    direction `step` from every cell where the mask of its k-th letter,
+    shifted by k * step, is set for all k. The border keeps every shifted
+    slice inside the grid.
+    """
+    masks = _letter_masks(data, word)
+    buffer = np.empty(BLOCK_SIZE, dtype=bool)
+    matches = 0
+    for lo, hi in _blocks(data):
+        found = buffer[: hi - lo]
+        for step in data.offsets8:
+            np.copyto(found, masks[word[0]][lo:hi])
+            for k, c in enumerate(word[1:], start=1):
+                shift = k * step
+                found &= masks[c][lo + shift : hi + shift]
+            matches += int(np.count_nonzero(found))
+    return matches
+
+
+def count_xmas_array(data: Grid) -> int:
+    """Same as `count_xmas`, with one mask of the 'A's whose both diagonals read MAS or SAM."""
+    masks = _letter_masks(data, b"MAS")
+    M, A, S = b"MAS"
+    _, north_east, _, south_east, _, south_west, _, north_west = data.offsets8
     matches = 0
-    for i, row in enumerate(data[1:-1], start=1):
-        for j, char in enumerate(row[1:-1], start=1):
-            if char == "A":
-                matches += is_xmas_puzzle(data, (i, j))
+    for lo, hi in _blocks(data):
+        def at(c: int, step: int) -> "np.ndarray":
+            return masks[c][lo + step : hi + step]
+
+        found = at(A, 0).copy()
+        found &= (at(M, north_east) & at(S, south_west)) | (at(S, north_east) & at(M, south_west))
+        found &= (at(M, north_west) & at(S, south_east)) | (at(S, north_west) & at(M, south_east))
+        matches += int(np.count_nonzero(found))
     return matches
 
 
@@ -107,12 +151,24 @@ def tests():
         MAMMMXMMMM
         MXMXAXMASX
     """
-    test_data = [list(line.strip()) for line in test_data.strip().split("\n")]
+    test_data = parse_data(test_data)
     assert part1(test_data) == 18
+    assert part2(test_data) == 9
+    assert search_word(test_data, WORD, test_data.index(0, 5), test_data.offsets8[2]) == 1
+
+    # the per-cell searches, whatever part1/part2 use
+    assert count_word(test_data, WORD) == 18
+    assert count_xmas(test_data) == 9
+    if np is not None:
+        assert count_word_array(test_data, WORD) == 18
+        assert count_xmas_array(test_data) == 9
+        assert count_word_array(parse_data("XMAS"), WORD) == 1
+        assert count_word_array(parse_data("X\nM\nA\nS"), b"SAMX") == 1
 
 
-data = load_data() 
-tests()
+if __name__ == "__main__":
+    tests()
 
-print("Part 1:", part1(data))
-print("Part 2:", part2(data))
\ No newline at end of file
+    data = parse_data(load_data())
+    print("Part 1:", part1(data))
+    print("Part 2:", part2(data))
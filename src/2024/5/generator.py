@@ -0,0 +1,29 @@
+"""
+Synthetic page ordering rules and updates: `size` is the number of pages.
+
+The rules come from a random total order of the pages and cover every pair of
+pages, so sorting any update is well defined. About half of the updates are
+already in the right order.
+"""
+import random
+
+
+def generate(
+    size: int, seed: int = 0, num_updates: int | None = None, max_update_len: int = 23
+) -> str:
+    rng = random.Random(seed)
+    order = rng.sample(range(10, 10 + 2 * size), size)
+    rank = {page: i for i, page in enumerate(order)}
+
+    rules = [f"{order[i]}|{order[j]}" for i in range(size) for j in range(i + 1, size)]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(size if num_updates is None else num_updates):
+        length = rng.randrange(1, min(size, max_update_len) + 1, 2)
+        pages = rng.sample(order, length)
+        if rng.random() < 0.5:
+            pages.sort(key=rank.__getitem__)
+        updates.append(",".join(map(str, pages)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 from dataclasses import dataclass
 from collections import defaultdict
@@ -5,6 +6,9 @@ from functools import cmp_to_key, partial
 
 
 SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.parsing import int_columns, int_lists
 
 Rules = dict[int, list[int]]
 Update = list[int]
@@ -25,14 +29,10 @@ def parse_data(data: str) -> PageUpdates:
     rules_data, upd_data = data.split("\n\n")
 
     rules = defaultdict(list)
-    for rule in rules_data.strip().split("\n"):
-        before, after = rule.strip().split("|")
-        rules[int(after)].append(int(before))
+    for before, after in zip(*int_columns(rules_data, 2)):
+        rules[after].append(before)
     
-    updates = [
-        [int(p) for p in upd.split(",")] 
-        for upd in upd_data.strip().split("\n")
-    ]
+    updates = int_lists(upd_data)
     return PageUpdates(rules, updates)
 
 
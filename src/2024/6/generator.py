@@ -0,0 +1,67 @@
+"""
+Synthetic guard maps: `size` is the side of the (square) map.
+
+A random map would very likely trap the guard in a loop, which part 1 can't
+handle, so the guard's walk is built first: obstacles are dropped in front of it
+at random points (never on a cell it already walked through) until it has
+turned `size` times, then it walks off the map. Extra obstacles are only placed
+on cells outside of that walk, so they don't change it.
+"""
+import random
+
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+
+def walk_guard(
+    rng: random.Random, size: int, grid: bytearray, start: int, max_turns: int
+) -> bytearray | None:
+    """Builds the walk in place on `grid`, returns the visited cells or None on a loop."""
+    visited = bytearray(size * size)
+    states = bytearray(size * size)
+    i, j = divmod(start, size)
+    direction = 0
+    turns = 0
+    mean_segment = max(size // 8, 2)
+
+    while True:
+        cell = i * size + j
+        if states[cell] & (1 << direction):
+            return None
+        states[cell] |= 1 << direction
+        visited[cell] = 1
+
+        di, dj = DIRECTIONS[direction]
+        n, m = i + di, j + dj
+        if not (0 <= n < size and 0 <= m < size):
+            return visited
+
+        next_cell = n * size + m
+        if (
+            turns < max_turns
+            and not visited[next_cell]
+            and rng.random() < 1 / mean_segment
+        ):
+            grid[next_cell] = ord("#")
+        if grid[next_cell] == ord("#"):
+            direction = (direction + 1) % 4
+            turns += 1
+        else:
+            i, j = n, m
+
+
+def generate(size: int, seed: int = 0, obstacle_density: float = 0.02) -> str:
+    rng = random.Random(seed)
+    while True:
+        grid = bytearray(b"." * (size * size))
+        start = rng.randrange(size // 4, 3 * size // 4 + 1) * size + rng.randrange(size)
+        visited = walk_guard(rng, size, grid, start, max_turns=size)
+        if visited is not None:
+            break
+
+    for cell in range(size * size):
+        if not visited[cell] and rng.random() < obstacle_density:
+            grid[cell] = ord("#")
+    grid[start] = ord("^")
+
+    rows = [grid[i : i + size].decode() for i in range(0, size * size, size)]
+    return "\n".join(rows) + "\n"
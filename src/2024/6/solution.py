@@ -1,83 +1,61 @@
+import sys
 from pathlib import Path
-from enum import Enum
 from typing import ClassVar
 
 
 SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc import metrics
+from aoc.grid import Grid
+
+# index into Grid.offsets4, which is ordered clockwise from north
+Direction = int
+N, E, S, W = range(4)
+
+OBSTACLE = ord("#")
 
-Position = tuple[int, int]
-
-class Directions(Enum):
-    N = (-1, 0)  
-    S = (1, 0)   
-    E = (0, 1)   
-    W = (0, -1)  
-
-    def move(self, start: tuple[int, int], steps: int = 1) -> tuple[int, int]:
-        y0, x0 = start
-        dy, dx = self.value
-        return (y0 + steps * dy, x0 + steps * dx)
-
-    def rotate_clockwise(self) -> "Directions":
-        new_direction = {
-            Directions.N : Directions.E,
-            Directions.E: Directions.S,
-            Directions.S: Directions.W,
-            Directions.W: Directions.N
-        }[self]
-        return new_direction
-    
 
 class Guard:
-    DIRECTION_TO_CHAR: ClassVar[dict[Directions, str]] = {
-        Directions.N: "^", 
-        Directions.E: ">",
-        Directions.S: "v",
-        Directions.W: "<",
+    DIRECTION_TO_CHAR: ClassVar[dict[Direction, str]] = {
+        N: "^",
+        E: ">",
+        S: "v",
+        W: "<",
     }
 
-    def __init__(self, direction: Directions, pos: Position):
+    def __init__(self, direction: Direction, pos: int, map_size: int):
         self.direction = direction
         self.pos = pos
-        self.seen = {pos}
+        self.seen = bytearray(map_size)
+        self.seen[pos] = 1
 
     def render(self):
         return self.DIRECTION_TO_CHAR[self.direction]
-    
-    def get_next_position(self):
-        return self.direction.move(self.pos)
-    
-    def move(self):
-        self.pos = self.direction.move(self.pos)
-        self.seen.add(self.pos)
-
-    def move_to(self, pos: Position):
+
+    def move_until_next_colision(self, map: "Map") -> tuple[int, bool]:
+        cells = map.grid.cells
+        seen = self.seen
+        step = map.grid.offsets4[self.direction]
+        start = pos = self.pos
+        while cells[pos + step] not in (OBSTACLE, map.grid.border):
+            pos += step
+            seen[pos] = 1
         self.pos = pos
-        self.seen.add(self.pos)
 
+        if metrics.enabled:
+            # the guard only walks in a straight line here
+            metrics.incr("Guard.cells_stepped", (pos - start) // step)
+            metrics.incr("Guard.collisions")
 
-    def move_until_next_colision(self, map: "Map") -> tuple[Position, bool]:
-        next_pos = self.get_next_position()
-        while  not (map.is_boundary(next_pos) or map.is_obstacle(next_pos)):
-            self.move_to(next_pos)
-            next_pos = self.get_next_position()
-            
-        return self.pos, map.is_boundary(next_pos)
-    
+        return self.pos, map.is_boundary(pos + step)
 
     def rotate_clockwise(self):
-        self.direction = self.direction.rotate_clockwise()
-
+        self.direction = (self.direction + 1) % 4
 
     def number_of_distinct_positions(self):
-        return len(self.seen)
+        return self.seen.count(1)
 
-"""
-def distance(pos1: Position, pos2: Position) -> int:
-    y1, x1 = pos1 
-    y2, x2 = pos2
-    return abs(x2 - x1) + abs(y2 - y1)
-"""
 
 def load_data() -> str:
     with open(SCRIPT_DIR / "input.txt") as f:
@@ -86,65 +64,39 @@ def load_data() -> str:
 
 
 class Map:
-    def __init__(self, data: list[list[str]]):
-        self.data = data
-        self.ncols = len(data[0])
-        self.nrows = len(data)
-
-    def is_obstacle(self, pos: Position) -> bool:
-        i, j = pos
-        return self.data[i][j] == "#"
-    
-    def is_boundary(self, pos: Position) -> bool:
-        i, j = pos
-        return (not (0 <= i < self.nrows)) or (not (0 <= j < self.ncols))
-    
-    """
-    def get_next_colision(self, pos: Position, direction: Directions) -> tuple[Position, bool]:
-        next_pos = direction.move(pos)
-        while  not (self.is_boundary(next_pos) or self.is_obstacle(next_pos)):
-            #print(pos, next_pos)
-            pos = next_pos
-            next_pos = direction.move(next_pos)
-            
-        return pos, self.is_boundary(next_pos)
-    """
-    
-    def render(self, guard: Guard):
-        i, j = guard.pos
+    def __init__(self, grid: Grid):
+        self.grid = grid
 
-        old_val = self.data[i][j]
-        self.data[i][j] = guard.render()
+    def is_obstacle(self, pos: int) -> bool:
+        return self.grid.cells[pos] == OBSTACLE
 
-        map_str = "\n".join("".join(row) for row in self.data)
-        print("\n", map_str, "\n", sep="")
-        self.data[i][j] = old_val
+    def is_boundary(self, pos: int) -> bool:
+        return self.grid.is_border(pos)
 
+    def render(self, guard: Guard):
+        cells = self.grid.cells
+        old_val = cells[guard.pos]
+        cells[guard.pos] = ord(guard.render())
+        print("\n", self.grid, "\n", sep="")
+        cells[guard.pos] = old_val
 
 
-def find_guard(map_data: list[list[str]]) -> Guard:
-    char_to_direction = {
-       v: k for k, v in Guard.DIRECTION_TO_CHAR.items()
-    }
-    for i, row in enumerate(map_data):
-        for j, val in enumerate(row):
-            if val in char_to_direction:
-                return Guard(
-                    pos=(i, j), 
-                    direction=char_to_direction[val]
-                )
+def find_guard(grid: Grid) -> Guard:
+    for direction, char in Guard.DIRECTION_TO_CHAR.items():
+        for pos in grid.find(char.encode()):
+            return Guard(direction, pos, len(grid.cells))
 
     raise ValueError("Start position not found")
 
+
 def parse_data(data: str) -> tuple[Map, Guard]:
-    map_data = [list(line.strip()) for line in data.strip().splitlines()]
-    guard = find_guard(map_data)
-    i, j = guard.pos 
-    map_data[i][j] = "."
+    grid = Grid.from_text(data)
+    guard = find_guard(grid)
+    grid.cells[guard.pos] = ord(".")
+
+    return Map(grid), guard
 
-    return Map(map_data), guard
 
-    
 def part1(map_: Map, guard: Guard) -> int:
     while True:
         #map_.render(guard)
@@ -156,7 +108,7 @@ def part1(map_: Map, guard: Guard) -> int:
             guard.rotate_clockwise()
 
 
-def part2(data: list[list[str]]) -> int:
+def part2(map_: Map, guard: Guard) -> int:
     pass
 
 
@@ -183,4 +135,4 @@ if __name__ == "__main__":
     tests()
 
     print("Part 1:", part1(map_, guard))
-    #print("Part 2:", part2(data))
\ No newline at end of file
+    #print("Part 2:", part2(data))
@@ -0,0 +1,30 @@
+"""
+Synthetic calibration equations: `size` is the number of equations.
+
+Each result is computed from random operators (+, *, ||) applied left to right;
+roughly half of them are then nudged so the equation has no solution.
+"""
+import random
+
+
+def generate_equation(rng: random.Random, min_operands: int, max_operands: int) -> str:
+    operands = [rng.randint(1, 999) for _ in range(rng.randint(min_operands, max_operands))]
+    result = operands[0]
+    for x in operands[1:]:
+        operator = rng.choice("+*|")
+        if operator == "+":
+            result += x
+        elif operator == "*":
+            result *= x
+        else:
+            result = int(f"{result}{x}")
+
+    if rng.random() < 0.5:
+        result += rng.randint(1, 9)
+    return f"{result}: " + " ".join(map(str, operands))
+
+
+def generate(size: int, seed: int = 0, min_operands: int = 2, max_operands: int = 12) -> str:
+    rng = random.Random(seed)
+    lines = [generate_equation(rng, min_operands, max_operands) for _ in range(size)]
+    return "\n".join(lines) + "\n"
@@ -3,14 +3,19 @@ Adapted from: https://github.com/antcap96/advent_of_code/blob/main/python/year20
 """
 
 import operator as op
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
 
 SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
 
+from aoc import metrics
+from aoc.parsing import int_lists
 
-@dataclass
+
+@dataclass(slots=True)
 class Equation:
     operands: list[int]
     result: int
@@ -46,25 +51,35 @@ def load_data() -> str:
 
 
 def parse_data(data: str) -> list[Equation]:
-    equations = []
-    for line in data.strip().splitlines():
-        result, rhs = line.split(": ")
-        operands = [int(x) for x in rhs.strip().split(" ")]
-        equations.append(Equation(operands, int(result)))
-    return equations
+    return [Equation(row[1:], row[0]) for row in int_lists(data)]
 
 
 def is_solvable(numbers: list[int], result: int, inv_operators: list[InverseOperation]):
-    match numbers:
-        case [first]:
-            return first == result
-
-        case [*remaining, last]:
-            return any(
-                is_solvable(remaining, op.apply(result, last), inv_operators)
-                for op in inv_operators
-                if op.is_valid(result, last)
-            )
+    # depth first search over (operands left, result they must reach), undoing
+    # the operators from the last operand backwards
+    if not numbers:
+        return False
+    stack = [(len(numbers), result)]
+    nodes = 0
+    solvable = False
+    while stack:
+        n, result = stack.pop()
+        nodes += 1
+        if n == 1:
+            if numbers[0] == result:
+                solvable = True
+                break
+            continue
+
+        last = numbers[n - 1]
+        # pushed in reverse so they are tried in the order given
+        for inv_op in reversed(inv_operators):
+            if inv_op.is_valid(result, last):
+                stack.append((n - 1, inv_op.apply(result, last)))
+
+    if metrics.enabled:
+        metrics.incr("is_solvable.nodes", nodes)
+    return solvable
 
 
 def total_calibration_result(
@@ -103,6 +118,11 @@ def tests():
     assert part1(equations) == 3749
     assert part2(equations) == 11387
 
+    # far deeper than the recursion limit
+    operands = [1] * 100_000
+    assert is_solvable(operands, len(operands), [inverse_add, inverse_mul])
+    assert not is_solvable([], 0, [inverse_add, inverse_mul])
+
 
 if __name__ == "__main__":
     tests()
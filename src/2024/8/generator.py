@@ -0,0 +1,19 @@
+"""
+Synthetic antenna maps: `size` is the side of the (square) map.
+"""
+import random
+import string
+
+FREQUENCIES = string.digits + string.ascii_letters
+
+
+def generate(size: int, seed: int = 0, antenna_density: float = 0.01) -> str:
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(size):
+        row = [
+            rng.choice(FREQUENCIES) if rng.random() < antenna_density else "."
+            for _ in range(size)
+        ]
+        rows.append("".join(row))
+    return "\n".join(rows) + "\n"
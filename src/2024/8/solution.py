@@ -1,34 +1,39 @@
 import itertools as it
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator
 
 SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
+
+from aoc.grid import Grid
 
 F = str
 Position = tuple[int, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class Antenna[F: str]:
     frequency: F
     pos: Position
 
 
 class Map:
-    def __init__(self, data: list[list[str]]):
-        self.nrows = len(data)
-        self.ncols = len(data[0])
-        self.antennas: dict[F, list[Antenna[F]]] = self._parse_antennas(data)
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        self.nrows = grid.nrows
+        self.ncols = grid.ncols
+        self.antennas: dict[F, list[Antenna[F]]] = self._parse_antennas(grid)
 
     @staticmethod
-    def _parse_antennas(data: list[list[str]]) -> dict[F, list[Antenna[F]]]:
+    def _parse_antennas(grid: Grid) -> dict[F, list[Antenna[F]]]:
         antennas = defaultdict(list)
-        for i, row in enumerate(data):
-            for j, freq in enumerate(row):
-                if freq != ".":
-                    antennas[freq].append(Antenna(freq, (i, j)))
+        frequencies = set(grid.cells) - {ord("."), grid.border}
+        for freq in sorted(frequencies):
+            for idx in grid.find(bytes([freq])):
+                antennas[chr(freq)].append(Antenna(chr(freq), grid.position(idx)))
         return antennas
 
     def is_within_bounds(self, pos: Position) -> bool:
@@ -48,8 +53,7 @@ def load_data() -> str:
 
 
 def parse_data(data: str):
-    grid = [list(line.strip()) for line in data.strip().splitlines()]
-    return Map(grid)
+    return Map(Grid.from_text(data))
 
 
 def part1(map_: Map) -> int:
@@ -0,0 +1,30 @@
+"""
+Synthetic disk maps: `size` is the number of digits (rounded up to an odd
+number, so the map ends with a file).
+
+`move_files_part1` expects some free space to be left at the end of the
+compacted disk, i.e. a free span reaching past the total size of the files.
+Tiny random maps may not have one, so those are redrawn.
+"""
+import random
+
+
+def has_trailing_free_space(digits: list[int]) -> bool:
+    files_size = sum(digits[::2])
+    start = 0
+    for i, size in enumerate(digits):
+        if i % 2 == 1 and start + size > files_size:
+            return True
+        start += size
+    return False
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    size = max(size | 1, 3)
+    while True:
+        digits = [
+            rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9) for i in range(size)
+        ]
+        if has_trailing_free_space(digits):
+            return "".join(map(str, digits)) + "\n"
@@ -1,10 +1,16 @@
+import sys
+from array import array
+from itertools import accumulate
 from pathlib import Path
 from dataclasses import dataclass
 
 SCRIPT_DIR = Path(__file__).parent
+sys.path.append(str(SCRIPT_DIR.parents[1]))
 
+from aoc import metrics
 
-@dataclass(order=True)
+
+@dataclass(order=True, slots=True)
 class FileBlock:
     start: int
     size: int
@@ -18,7 +24,7 @@ class FileBlock:
         return str(self.id) * self.size
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class FreeBlock:
     start: int
     size: int
@@ -27,10 +33,24 @@ class FreeBlock:
         return "." * self.size
 
 
-@dataclass
+@dataclass(slots=True)
 class DiskMap:
-    file_blocks: list[FileBlock]
-    empty_blocks: list[FreeBlock]
+    """
+    Starts and sizes of the blocks as int64 columns, file i has id i. The blocks
+    are only built when a part asks for them, each gets its own fresh copies.
+    """
+    file_starts: array
+    file_sizes: array
+    empty_starts: array
+    empty_sizes: array
+
+    @property
+    def file_blocks(self) -> list[FileBlock]:
+        return list(map(FileBlock, self.file_starts, self.file_sizes, range(len(self.file_sizes))))
+
+    @property
+    def empty_blocks(self) -> list[FreeBlock]:
+        return list(map(FreeBlock, self.empty_starts, self.empty_sizes))
 
 
 def load_data() -> str:
@@ -40,19 +60,9 @@ def load_data() -> str:
 
 
 def parse_data(data: str) -> DiskMap:
-    file_blocks = []
-    empty_blocks = []
-    file_id = 0
-    start = 0
-    for i, size in enumerate(data.strip()):
-        if i % 2 == 0:
-            file_blocks.append(FileBlock(start, int(size), file_id))
-            file_id += 1
-        else:
-            empty_blocks.append(FreeBlock(start, int(size)))
-        start += int(size)
-
-    return DiskMap(file_blocks, empty_blocks)
+    sizes = array("q", map(int, data.strip()))
+    starts = array("q", accumulate(sizes[:-1], initial=0))
+    return DiskMap(starts[0::2], sizes[0::2], starts[1::2], sizes[1::2])
 
 
 def move_files_part1(disk_map: DiskMap) -> list[FileBlock]:
@@ -109,6 +119,9 @@ def move_files_part2(disk_map: DiskMap) -> list[FileBlock]:
             free_idx += 1
             free = free_blocks[free_idx]
 
+        if metrics.enabled:
+            metrics.incr("move_files_part2.free_blocks_scanned", free_idx + 1)
+
         space_remaining = free.size - block.size
 
         if (space_remaining >= 0) and (free.start < block.start):
@@ -0,0 +1 @@
+"""Shared tooling to discover, run and measure the per-day solutions."""
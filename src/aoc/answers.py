@@ -0,0 +1,69 @@
+"""
+Answers of previous runs, stored per day in `<day>/.cache/answers.json`.
+
+An entry is keyed by a hash of the day's modules (plus the shared `aoc`
+modules they import), of the input text and of the Python version, so a
+day is only recomputed once one of them changes.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+from aoc.cache import CACHE_DIR_NAME, aoc_dependencies
+from aoc.days import Day
+
+ANSWERS_FILE_NAME = "answers.json"
+
+
+def solution_files(day: Day) -> list[Path]:
+    # every module of the day, solutions may load helpers next to them (e.g.
+    # the scanner of 2023 Day 1)
+    files = set(day.module_files()) | set(day.path.glob("*.py"))
+    for path in list(files):
+        files |= aoc_dependencies(path)
+    return sorted(files)
+
+
+def answer_key(day: Day, text: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for path in solution_files(day):
+        h.update(path.read_bytes())
+    h.update(text.encode())
+    h.update(sys.version.encode())
+    return h.hexdigest()
+
+
+def _answers_file(day: Day) -> Path:
+    return day.path / CACHE_DIR_NAME / ANSWERS_FILE_NAME
+
+
+def _load_entries(day: Day) -> dict[str, dict[str, Any]]:
+    try:
+        with open(_answers_file(day)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def load_answers(day: Day, key: str) -> Optional[dict[str, Any]]:
+    entry = _load_entries(day).get(key)
+    return None if entry is None else entry["answers"]
+
+
+def store_answers(day: Day, key: str, input_name: str, answers: dict[str, Any]) -> None:
+    """Stores `answers`, replacing any older entry computed for the same input file."""
+    entries = {
+        k: entry for k, entry in _load_entries(day).items() if entry["input"] != input_name
+    }
+    entries[key] = {"input": input_name, "answers": answers}
+
+    path = _answers_file(day)
+    path.parent.mkdir(exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(entries, f, indent=4, default=str)
+    os.replace(tmp_path, path)
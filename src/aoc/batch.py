@@ -0,0 +1,107 @@
+"""
+Solve a whole directory of inputs of one day, spread over worker processes.
+
+Usage (from the src directory):
+
+    python -m aoc.batch --year 2024 --day 11 inputs/
+    python -m aoc.batch --year 2024 --day 7 inputs/ --pattern "scaled-*.txt" -j 4 --format json
+
+Each worker loads the day once and keeps it for all the inputs it is given, so
+module level caches such as `change_stone`'s `@cache` in 2024/11 stay warm
+from one input to the next. One line is printed per input as soon as it is
+solved (in input order), with its answers and timings.
+"""
+
+import argparse
+import json
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from functools import partial
+from pathlib import Path
+from typing import Iterator, Optional
+
+from aoc.days import Day, Solution, discover_days, select_days
+from aoc.runner import DayResult, solve_input
+
+# the day loaded by the current (worker) process
+_solution: Optional[Solution] = None
+
+
+def _init_worker(day: Day) -> None:
+    global _solution
+    _solution = day.load()
+
+
+def _solve_file(path: Path, use_cache: bool = False) -> DayResult:
+    result = DayResult(str(path))
+    try:
+        with open(path) as f:
+            text = f.read()
+        solve_input(_solution, text, result, use_cache=use_cache)
+    except Exception:
+        result.error = traceback.format_exc(limit=-1).strip()
+    return result
+
+
+def solve_batch(
+    day: Day, paths: list[Path], jobs: Optional[int] = None, use_cache: bool = False
+) -> Iterator[DayResult]:
+    solve = partial(_solve_file, use_cache=use_cache)
+    if jobs == 1:
+        _init_worker(day)
+        yield from map(solve, paths)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(day,)
+    ) as executor:
+        yield from executor.map(solve, paths)
+
+
+def format_line(result: DayResult) -> str:
+    if result.error:
+        return f"{result.day}  error: {result.error.splitlines()[-1]}"
+    return (
+        f"{result.day}  parse {result.parse_time * 1000:.1f}ms"
+        f"  part1 {result.part1} ({result.part1_time * 1000:.1f}ms)"
+        f"  part2 {result.part2} ({result.part2_time * 1000:.1f}ms)"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("directory", type=Path, help="directory holding the inputs")
+    parser.add_argument("--year", type=int, required=True)
+    parser.add_argument("--day", type=int, required=True)
+    parser.add_argument("--pattern", default="*.txt", help="glob selecting the inputs")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes"
+    )
+    parser.add_argument("--format", choices=["lines", "json"], default="lines")
+    parser.add_argument("--cache", action="store_true", help="cache the parsed inputs")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    days = select_days(discover_days(), [args.year], [args.day])
+    if not days:
+        print(f"No solution found for {args.year} day {args.day}", file=sys.stderr)
+        return 2
+
+    paths = sorted(args.directory.glob(args.pattern))
+    failures = 0
+    for result in solve_batch(days[0], paths, jobs=args.jobs, use_cache=args.cache):
+        failures += result.error is not None
+        if args.format == "json":
+            print(json.dumps(asdict(result), default=str), flush=True)
+        else:
+            print(format_line(result), flush=True)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
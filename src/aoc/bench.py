@@ -0,0 +1,251 @@
+"""
+Benchmark parse/part1/part2 of every day and detect slowdowns against a baseline.
+
+Usage (from the src directory):
+
+    python -m aoc.bench --repeat 7 --warmup 1 --save   # record the current commit
+    python -m aoc.bench --compare --threshold 0.15     # flag slowdowns over 15%
+    python -m aoc.bench --year 2024 --day 9 --compare --baseline 1a2b3c4
+
+Results are stored in a JSON history file keyed by `<commit>@<python version>`,
+so numbers from different interpreters are never compared with each other.
+Module level caches are cleared before every run, otherwise memoized days
+(e.g. 2024/11) would only be measured once.
+
+With --compare the exit status is 1 when there are regressions and 2 when
+there is no baseline to compare with (e.g. a --baseline missing from the
+history), so that neither passes for "no slowdown".
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import traceback
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from aoc.days import SRC_DIR, Day, discover_days, select_days
+
+HISTORY_FILE = SRC_DIR.parent / "bench_history.json"
+FUNCTIONS = ("parse", "part1", "part2")
+# exit statuses of --compare
+REGRESSION_STATUS = 1
+NO_BASELINE_STATUS = 2
+
+
+@dataclass
+class Timing:
+    min: float
+    median: float
+    mean: float
+    runs: int
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "Timing":
+        return cls(
+            min=min(samples),
+            median=statistics.median(samples),
+            mean=statistics.fmean(samples),
+            runs=len(samples),
+        )
+
+
+@dataclass
+class Regression:
+    day: str
+    function: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def bench_day(day: Day, repeat: int = 5, warmup: int = 1) -> dict[str, Timing]:
+    solution = day.load()
+    text = day.read_input()
+    samples: dict[str, list[float]] = {name: [] for name in FUNCTIONS}
+
+    for i in range(warmup + repeat):
+        solution.clear_caches()
+        for part in (1, 2):
+            start = time.perf_counter()
+            parsed = solution.parse(text, part)
+            parse_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            solution.solve(parsed, part)
+            part_time = time.perf_counter() - start
+
+            if i >= warmup:
+                if part == 1:
+                    samples["parse"].append(parse_time)
+                samples[f"part{part}"].append(part_time)
+
+    return {name: Timing.from_samples(times) for name, times in samples.items()}
+
+
+def current_commit() -> str:
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=SRC_DIR, capture_output=True, text=True
+        ).stdout.strip()
+
+    commit = git("rev-parse", "--short", "HEAD") or "unknown"
+    if git("status", "--porcelain", "--untracked-files=no"):
+        commit += "-dirty"
+    return commit
+
+
+def python_version() -> str:
+    return platform.python_version()
+
+
+def history_key(commit: str, python: str) -> str:
+    return f"{commit}@{python}"
+
+
+def load_history(path: Path = HISTORY_FILE) -> dict:
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_results(
+    results: dict[str, dict[str, Timing]],
+    commit: str,
+    python: str,
+    path: Path = HISTORY_FILE,
+) -> None:
+    history = load_history(path)
+    entry = history.setdefault(
+        history_key(commit, python), {"commit": commit, "python": python, "results": {}}
+    )
+    entry["date"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    for day, timings in results.items():
+        entry["results"][day] = {name: asdict(t) for name, t in timings.items()}
+
+    with open(path, "w") as f:
+        json.dump(history, f, indent=4)
+
+
+def find_baseline(
+    history: dict, commit: str, python: str, baseline: Optional[str] = None
+) -> Optional[dict]:
+    """
+    The entry to compare against: `baseline` may be a full history key or just a
+    commit, in which case the entry for the current Python version is used. By
+    default the most recent entry of another commit with the same Python is taken.
+    """
+    if baseline is not None:
+        return history.get(baseline) or history.get(history_key(baseline, python))
+
+    candidates = [
+        entry
+        for entry in history.values()
+        if entry["python"] == python and entry["commit"] != commit
+    ]
+    return max(candidates, key=lambda entry: entry["date"], default=None)
+
+
+def find_regressions(
+    results: dict[str, dict[str, Timing]], baseline: dict, threshold: float
+) -> list[Regression]:
+    regressions = []
+    for day, timings in results.items():
+        base_timings = baseline["results"].get(day, {})
+        for name, timing in timings.items():
+            if name not in base_timings:
+                continue
+            base = base_timings[name]["median"]
+            if base > 0 and timing.median > base * (1 + threshold):
+                regressions.append(Regression(day, name, base, timing.median))
+    return regressions
+
+
+def format_results(
+    results: dict[str, dict[str, Timing]],
+    baseline: Optional[dict] = None,
+    errors: Optional[dict[str, str]] = None,
+) -> str:
+    lines = [f"{'day':<12}{'function':<10}{'median':>12}{'min':>12}{'baseline':>12}{'ratio':>8}"]
+    for day, timings in results.items():
+        base_timings = (baseline or {}).get("results", {}).get(day, {})
+        for name, timing in timings.items():
+            line = f"{day:<12}{name:<10}{timing.median * 1000:>10.2f}ms{timing.min * 1000:>10.2f}ms"
+            if name in base_timings:
+                base = base_timings[name]["median"]
+                ratio = timing.median / base if base > 0 else float("nan")
+                line += f"{base * 1000:>10.2f}ms{ratio:>8.2f}"
+            lines.append(line)
+    for day, error in (errors or {}).items():
+        lines.append(f"{day:<12}error: {error.splitlines()[-1]}")
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, nargs="+", help="years to run (default: all)")
+    parser.add_argument("--day", type=int, nargs="+", help="days to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="measured runs per day")
+    parser.add_argument("--warmup", type=int, default=1, help="discarded runs per day")
+    parser.add_argument("--history", type=Path, default=HISTORY_FILE)
+    parser.add_argument("--save", action="store_true", help="store results in the history")
+    parser.add_argument("--compare", action="store_true", help="compare with a baseline")
+    parser.add_argument("--baseline", help="commit or commit@python to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="relative slowdown of the median that counts as a regression",
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    days = select_days(discover_days(), args.year, args.day)
+    commit, python = current_commit(), python_version()
+
+    results, errors = {}, {}
+    for day in days:
+        # a failing day (e.g. syntax of a newer Python) doesn't stop the others
+        try:
+            results[day.key] = bench_day(day, repeat=args.repeat, warmup=args.warmup)
+        except Exception:
+            errors[day.key] = traceback.format_exc(limit=-1).strip()
+
+    baseline = None
+    if args.compare:
+        baseline = find_baseline(load_history(args.history), commit, python, args.baseline)
+        if baseline is None:
+            print("No baseline found to compare with", file=sys.stderr)
+
+    print(f"commit {commit}, python {python}")
+    print(format_results(results, baseline, errors))
+
+    if args.save:
+        save_results(results, commit, python, args.history)
+
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, args.threshold)
+        print(f"\nbaseline {baseline['commit']}: {len(regressions)} regression(s)")
+        for r in regressions:
+            print(
+                f"  {r.day} {r.function}: {r.baseline * 1000:.2f}ms -> "
+                f"{r.current * 1000:.2f}ms ({r.ratio:.2f}x)"
+            )
+        return REGRESSION_STATUS if regressions else 0
+    return NO_BASELINE_STATUS if args.compare else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Binary cache of parsed inputs, stored in a `.cache` directory next to the input.
+
+Entries are pickles keyed by a hash of the input text and a hash of the source
+of the parser's module (a parser usually relies on the module's classes and
+helpers, e.g. `Game.from_string` in 2023 Day 2, so the whole file is hashed)
+along with the `aoc` modules it imports, directly or not (e.g. `int_lists` of
+aoc/parsing.py or `Grid.from_text`). Editing any of them makes the old entry
+unreachable; entries written by older versions of a parser are deleted when
+the new one is stored.
+"""
+
+import ast
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+CACHE_DIR_NAME = ".cache"
+
+SRC_DIR = Path(__file__).parent.parent
+
+
+def _digest(*chunks: bytes) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for chunk in chunks:
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def input_hash(text: str) -> str:
+    return _digest(text.encode())
+
+
+def _imported_aoc_files(path: Path) -> set[Path]:
+    modules = set()
+    for node in ast.walk(ast.parse(path.read_bytes())):
+        if isinstance(node, ast.ImportFrom) and node.module == "aoc":
+            modules.update(f"aoc.{alias.name}" for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and (node.module or "").startswith("aoc."):
+            modules.add(node.module)
+        elif isinstance(node, ast.Import):
+            modules.update(a.name for a in node.names if a.name.startswith("aoc."))
+
+    files = {SRC_DIR / (module.replace(".", "/") + ".py") for module in modules}
+    return {file for file in files if file.exists()}
+
+
+def aoc_dependencies(path: Path) -> set[Path]:
+    """The files of the `aoc` modules imported by `path`, directly or through each other."""
+    files: set[Path] = set()
+    todo = [path]
+    while todo:
+        for file in _imported_aoc_files(todo.pop()) - files:
+            files.add(file)
+            todo.append(file)
+    return files
+
+
+def source_hash(path: Path) -> str:
+    """Hash of the module at `path` and of the `aoc` modules it depends on."""
+    version = ".".join(map(str, sys.version_info[:2]))
+    paths = [path, *sorted(aoc_dependencies(path) - {path})]
+    return _digest(*(p.read_bytes() for p in paths), version.encode())
+
+
+def _entry_prefix(parser: Callable[[str], Any]) -> str:
+    module_file = Path(inspect.getsourcefile(parser))
+    return f"{module_file.stem}.{parser.__qualname__}"
+
+
+def cache_path(parser: Callable[[str], Any], text: str, cache_dir: Path) -> Path:
+    module_file = Path(inspect.getsourcefile(parser))
+    name = f"{_entry_prefix(parser)}.{source_hash(module_file)}.{input_hash(text)}.pickle"
+    return cache_dir / name
+
+
+def _remove_stale_entries(path: Path, prefix: str) -> None:
+    parser_hash = path.name.removeprefix(prefix).split(".")[1]
+    for entry in path.parent.glob(f"{prefix}.*.pickle"):
+        if entry.name.removeprefix(prefix).split(".")[1] != parser_hash:
+            entry.unlink(missing_ok=True)
+
+
+def cached_parse(parser: Callable[[str], Any], text: str, cache_dir: Path) -> Any:
+    path = cache_path(parser, text, cache_dir)
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (FileNotFoundError, EOFError, AttributeError, pickle.UnpicklingError):
+        pass
+
+    parsed = parser(text)
+    cache_dir.mkdir(exist_ok=True)
+    # write then rename, so concurrent runs never read a half written entry
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    _remove_stale_entries(path, _entry_prefix(parser))
+    return parsed
@@ -0,0 +1,184 @@
+"""
+Discovery and lazy loading of the solutions living under src/<year>/<day>.
+
+A day is any directory below a year directory that holds a solution module:
+either a single `solution.py`/`both.py`, or one `part1.py`/`part2.py` per part.
+Modules are only imported when a day is actually solved, and they are expected
+to expose:
+
+    parse_data(text)  -> parsed input (optional, defaults to the raw text)
+    part1(parsed)     -> answer
+    part2(parsed)     -> answer
+    tests()           -> asserts on the examples (`run_tests` is also accepted)
+
+Days may also ship a `generator.py` building synthetic inputs of any size.
+
+When `parse_data` returns a tuple it is unpacked into the part functions, e.g.
+`part1(left, right)` in 2024/1.
+"""
+
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Optional
+
+from aoc.cache import CACHE_DIR_NAME, cached_parse
+
+SRC_DIR = Path(__file__).parent.parent
+INPUT_FILE_NAME = "input.txt"
+SINGLE_MODULE_NAMES = ("solution.py", "both.py")
+PART_MODULE_NAMES = {1: "part1.py", 2: "part2.py"}
+TEST_FUNCTION_NAMES = ("tests", "run_tests")
+GENERATOR_MODULE_NAME = "generator.py"
+
+
+@dataclass(frozen=True, order=True)
+class Day:
+    year: int
+    number: int
+    path: Path
+
+    @property
+    def key(self) -> str:
+        return f"{self.year}/{self.path.name}"
+
+    @property
+    def input_file(self) -> Path:
+        return self.path / INPUT_FILE_NAME
+
+    def module_file(self, part: int) -> Path:
+        part_file = self.path / PART_MODULE_NAMES[part]
+        if part_file.exists():
+            return part_file
+        for name in SINGLE_MODULE_NAMES:
+            if (self.path / name).exists():
+                return self.path / name
+        raise FileNotFoundError(f"No solution module for part {part} of {self.key}")
+
+    def module_files(self) -> list[Path]:
+        return sorted({self.module_file(part) for part in PART_MODULE_NAMES})
+
+    def read_input(self) -> str:
+        with open(self.input_file) as f:
+            return f.read()
+
+    @property
+    def generator_file(self) -> Path:
+        return self.path / GENERATOR_MODULE_NAME
+
+    def load(self) -> "Solution":
+        return Solution(self)
+
+    def load_generator(self) -> ModuleType:
+        """The day's `generator.py`, exposing `generate(size, seed=0, **options) -> str`."""
+        return load_module(self.generator_file)
+
+
+def _has_solution(path: Path) -> bool:
+    names = (*SINGLE_MODULE_NAMES, *PART_MODULE_NAMES.values())
+    return any((path / name).exists() for name in names)
+
+
+def _day_number(path: Path) -> int:
+    match = re.search(r"\d+", path.name)
+    if match is None:
+        raise ValueError(f"Can't infer the day number from {path}")
+    return int(match.group())
+
+
+def discover_days(src_dir: Path = SRC_DIR) -> list[Day]:
+    days = []
+    for year_dir in src_dir.iterdir():
+        if not (year_dir.is_dir() and year_dir.name.isdigit()):
+            continue
+        for day_dir in year_dir.iterdir():
+            if day_dir.is_dir() and _has_solution(day_dir):
+                days.append(Day(int(year_dir.name), _day_number(day_dir), day_dir))
+    return sorted(days)
+
+
+def get_day(key: str) -> Day:
+    """The day with the given key, e.g. "2024/7" or "2023/Day 3"."""
+    for day in discover_days():
+        if day.key == key:
+            return day
+    raise KeyError(f"No solution found for {key}")
+
+
+def select_days(
+    days: Iterable[Day],
+    years: Optional[Iterable[int]] = None,
+    numbers: Optional[Iterable[int]] = None,
+) -> list[Day]:
+    years = set(years or [])
+    numbers = set(numbers or [])
+    return [
+        day
+        for day in days
+        if (not years or day.year in years) and (not numbers or day.number in numbers)
+    ]
+
+
+def load_module(path: Path) -> ModuleType:
+    day_dir = path.parent
+    name = "_".join(
+        ["aoc_day", day_dir.parent.name, day_dir.name.replace(" ", "_"), path.stem]
+    )
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    # registered so that pickle can find the module's classes again
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _identity(text: str) -> str:
+    return text
+
+
+class Solution:
+    """The loaded modules of a day, with uniform access to parse/part/tests."""
+
+    def __init__(self, day: Day):
+        self.day = day
+        self.modules: dict[Path, ModuleType] = {
+            path: load_module(path) for path in day.module_files()
+        }
+
+    def module(self, part: int) -> ModuleType:
+        return self.modules[self.day.module_file(part)]
+
+    def parser(self, part: int) -> Callable[[str], Any]:
+        return getattr(self.module(part), "parse_data", _identity)
+
+    def part_function(self, part: int) -> Callable[..., Any]:
+        return getattr(self.module(part), f"part{part}")
+
+    def parse(self, text: str, part: int = 1, cached: bool = False) -> Any:
+        parser = self.parser(part)
+        if cached and parser is not _identity:
+            return cached_parse(parser, text, self.day.path / CACHE_DIR_NAME)
+        return parser(text)
+
+    def solve(self, parsed: Any, part: int) -> Any:
+        func = self.part_function(part)
+        if isinstance(parsed, tuple):
+            return func(*parsed)
+        return func(parsed)
+
+    def clear_caches(self) -> None:
+        """Reset module level memoization (e.g. `@cache` in 2024/11) between runs."""
+        for module in self.modules.values():
+            for obj in vars(module).values():
+                if callable(getattr(obj, "cache_clear", None)):
+                    obj.cache_clear()
+
+    def run_tests(self) -> None:
+        for module in self.modules.values():
+            for name in TEST_FUNCTION_NAMES:
+                if hasattr(module, name):
+                    getattr(module, name)()
+                    break
@@ -0,0 +1,293 @@
+"""
+Differential testing of fast implementations against their reference versions.
+
+Usage (from the src directory):
+
+    python -m aoc.difftest                      # every registered comparison
+    python -m aoc.difftest "2024/7 part2" --cases 500 --seed 3
+
+A comparison feeds the same cases (fixed ones, e.g. the examples stored in
+2024/2/tests.json, plus randomly drawn ones) to a reference function and to a
+candidate, checks that they agree and reports how much faster the candidate
+is. The first mismatch is shrunk to a minimal failing case before reporting.
+
+New comparisons are added with the `register` decorator:
+
+    @register("2024/9 part2")
+    def _day9_part2() -> Comparison:
+        ...
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Iterator, Optional
+
+from aoc.days import Day, get_day, load_module
+
+
+@dataclass
+class Comparison:
+    reference: Callable[[Any], Any]
+    candidate: Callable[[Any], Any]
+    draw_case: Callable[[random.Random], Any]
+    shrink: Callable[[Any], Iterator[Any]]
+    fixed_cases: list[Any] = field(default_factory=list)
+
+
+@dataclass
+class Mismatch:
+    case: Any
+    expected: Any
+    actual: Any
+
+
+@dataclass
+class Report:
+    name: str
+    cases: int
+    reference_time: float
+    candidate_time: float
+    mismatches: int = 0
+    first_mismatch: Optional[Mismatch] = None
+
+    @property
+    def speedup(self) -> float:
+        return self.reference_time / self.candidate_time if self.candidate_time else float("inf")
+
+
+REGISTRY: dict[str, Callable[[], Comparison]] = {}
+
+
+def register(name: str) -> Callable[[Callable[[], Comparison]], Callable[[], Comparison]]:
+    def decorator(factory: Callable[[], Comparison]) -> Callable[[], Comparison]:
+        REGISTRY[name] = factory
+        return factory
+
+    return decorator
+
+
+# ---------- shrinking ----------
+
+
+def shrink_lines(text: str) -> Iterator[str]:
+    """Drops chunks of lines, from halves of the input down to single lines."""
+    lines = text.strip().splitlines()
+    chunk = len(lines) // 2
+    while chunk >= 1:
+        for start in range(0, len(lines), chunk):
+            remaining = lines[:start] + lines[start + chunk :]
+            if remaining:
+                yield "\n".join(remaining) + "\n"
+        chunk //= 2
+
+
+def shrink_list(values: list[int]) -> Iterator[list[int]]:
+    """Drops single elements, then shifts the values down towards 1."""
+    for i in range(len(values)):
+        yield values[:i] + values[i + 1 :]
+    if values and min(values) > 1:
+        yield [x - min(values) + 1 for x in values]
+
+
+def minimize(case: Any, fails: Callable[[Any], bool], shrink: Callable[[Any], Iterator[Any]]) -> Any:
+    improved = True
+    while improved:
+        improved = False
+        for smaller in shrink(case):
+            if fails(smaller):
+                case, improved = smaller, True
+                break
+    return case
+
+
+# ---------- running ----------
+
+
+def _call(func: Callable[[Any], Any], case: Any) -> tuple[Any, float]:
+    start = time.perf_counter()
+    try:
+        result = func(case)
+    except Exception as e:
+        result = f"{type(e).__name__}: {e}"
+    return result, time.perf_counter() - start
+
+
+def run_comparison(name: str, num_cases: int = 200, seed: int = 0) -> Report:
+    comparison = REGISTRY[name]()
+    rng = random.Random(seed)
+    cases = comparison.fixed_cases + [comparison.draw_case(rng) for _ in range(num_cases)]
+
+    report = Report(name, len(cases), 0.0, 0.0)
+    for case in cases:
+        expected, reference_time = _call(comparison.reference, case)
+        actual, candidate_time = _call(comparison.candidate, case)
+        report.reference_time += reference_time
+        report.candidate_time += candidate_time
+
+        if expected != actual:
+            report.mismatches += 1
+            if report.first_mismatch is None:
+                def fails(c: Any) -> bool:
+                    return _call(comparison.reference, c)[0] != _call(comparison.candidate, c)[0]
+
+                case = minimize(case, fails, comparison.shrink)
+                report.first_mismatch = Mismatch(
+                    case, _call(comparison.reference, case)[0], _call(comparison.candidate, case)[0]
+                )
+    return report
+
+
+def format_report(report: Report) -> str:
+    status = "ok" if report.mismatches == 0 else f"{report.mismatches} mismatch(es)"
+    lines = [
+        f"{report.name}: {status} over {report.cases} cases, "
+        f"reference {report.reference_time * 1000:.1f}ms, "
+        f"candidate {report.candidate_time * 1000:.1f}ms, "
+        f"speedup {report.speedup:.2f}x"
+    ]
+    if report.first_mismatch is not None:
+        m = report.first_mismatch
+        lines.append(f"  minimal case: {m.case!r}")
+        lines.append(f"  reference: {m.expected!r}, candidate: {m.actual!r}")
+    return "\n".join(lines)
+
+
+# ---------- comparisons ----------
+
+
+def _whole_input(day: Day, module_name: str, part: int) -> Callable[[str], Any]:
+    module = load_module(day.path / module_name)
+    part_function = getattr(module, f"part{part}")
+    return lambda text: part_function(module.parse_data(text))
+
+
+def _generated_inputs(day: Day, max_size: int, **options: Any) -> Callable[[random.Random], str]:
+    generator = day.load_generator()
+    return lambda rng: generator.generate(
+        rng.randint(1, max_size), seed=rng.randrange(2**32), **options
+    )
+
+
+def _day1(part: int) -> Comparison:
+    day = get_day("2024/1")
+    module = load_module(day.path / "solution.py")
+    lists_part, arrays_part = [
+        (module.total_distance, module.total_distance_arrays),
+        (module.similarity_score, module.similarity_score_arrays),
+    ][part - 1]
+    return Comparison(
+        reference=lambda text: lists_part(*module.parse_lists(text)),
+        candidate=lambda text: arrays_part(*module.parse_arrays(text)),
+        draw_case=_generated_inputs(day, max_size=50, max_value=10020),
+        shrink=shrink_lines,
+    )
+
+
+register("2024/1 part1 arrays")(lambda: _day1(1))
+register("2024/1 part2 arrays")(lambda: _day1(2))
+
+
+def _day4(part: int) -> Comparison:
+    day = get_day("2024/4")
+    module = load_module(day.path / "solution.py")
+    loop_count, array_count = [
+        (partial(module.count_word, word=module.WORD), partial(module.count_word_array, word=module.WORD)),
+        (module.count_xmas, module.count_xmas_array),
+    ][part - 1]
+    return Comparison(
+        reference=lambda text: loop_count(module.parse_data(text)),
+        candidate=lambda text: array_count(module.parse_data(text)),
+        draw_case=_generated_inputs(day, max_size=25),
+        shrink=shrink_lines,
+    )
+
+
+register("2024/4 part1 arrays")(lambda: _day4(1))
+register("2024/4 part2 arrays")(lambda: _day4(2))
+
+
+def _day7(part: int) -> Comparison:
+    day = get_day("2024/7")
+    return Comparison(
+        reference=_whole_input(day, "brute_force_solution.py", part),
+        candidate=_whole_input(day, "solution.py", part),
+        draw_case=_generated_inputs(day, max_size=15, max_operands=7),
+        shrink=shrink_lines,
+    )
+
+
+register("2024/7 part1")(lambda: _day7(1))
+register("2024/7 part2")(lambda: _day7(2))
+
+
+@register("2024/2 dampened")
+def _day2_dampened() -> Comparison:
+    day = get_day("2024/2")
+    module = load_module(day.path / "solution.py")
+    with open(day.path / "tests.json") as f:
+        fixed_cases = [report for report, _ in json.load(f)]
+
+    def draw_report(rng: random.Random) -> list[int]:
+        report = [rng.randint(1, 20)]
+        for _ in range(rng.randint(1, 7)):
+            report.append(report[-1] + rng.randint(-4, 4))
+        return report
+
+    return Comparison(
+        reference=module.is_report_safe_brute_force,
+        candidate=module.is_report_safe_dampened,
+        draw_case=draw_report,
+        shrink=shrink_list,
+        fixed_cases=fixed_cases,
+    )
+
+
+@register("2024/2 batched")
+def _day2_batched() -> Comparison:
+    day = get_day("2024/2")
+    module = load_module(day.path / "solution.py")
+
+    def reference(text: str) -> list[bool]:
+        return [module.is_report_safe_brute_force(report) for report in module.parse_data(text)]
+
+    def candidate(text: str) -> list[bool]:
+        return module.classify_reports(*module.parse_arrays(text))[1].tolist()
+
+    return Comparison(
+        reference=reference,
+        candidate=candidate,
+        draw_case=_generated_inputs(day, max_size=30, min_len=2),
+        shrink=shrink_lines,
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("names", nargs="*", help="comparisons to run (default: all)")
+    parser.add_argument("--cases", type=int, default=200, help="random cases per comparison")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--list", action="store_true", help="list the registered comparisons")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.list:
+        print("\n".join(REGISTRY))
+        return 0
+
+    failures = 0
+    for name in args.names or list(REGISTRY):
+        report = run_comparison(name, args.cases, args.seed)
+        failures += report.mismatches > 0
+        print(format_report(report))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Write synthetic inputs built by the days' `generator.py` modules.
+
+Usage (from the src directory):
+
+    python -m aoc.generate --year 2024 --day 9 --size 1000000 --seed 7 -o big.txt
+    python -m aoc.generate --year 2024 --day 6 --size 5000 --option obstacle_density=0.05
+    python -m aoc.generate --check              # generated inputs solve on every day
+
+`--check` generates a small input for each selected day and runs it through
+the day's own parse_data/part1/part2.
+"""
+
+import argparse
+import ast
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+from aoc.days import Day, discover_days, select_days
+
+CHECK_SIZES = {
+    (2024, 5): 30,
+    (2024, 11): 5,
+}
+DEFAULT_CHECK_SIZE = 50
+
+
+def generate_input(day: Day, size: int, seed: int = 0, **options: Any) -> str:
+    return day.load_generator().generate(size, seed=seed, **options)
+
+
+def check_day(day: Day, seeds: range = range(3)) -> None:
+    solution = day.load()
+    size = CHECK_SIZES.get((day.year, day.number), DEFAULT_CHECK_SIZE)
+    for seed in seeds:
+        text = generate_input(day, size, seed=seed)
+        for part in (1, 2):
+            solution.solve(solution.parse(text, part), part)
+
+
+def parse_option(option: str) -> tuple[str, Any]:
+    name, _, value = option.partition("=")
+    try:
+        return name, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return name, value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, nargs="+", help="years (default: all)")
+    parser.add_argument("--day", type=int, nargs="+", help="days (default: all)")
+    parser.add_argument("--size", type=int, default=1000, help="size knob of the generator")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--option",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="extra keyword argument for the generator",
+    )
+    parser.add_argument("-o", "--output", type=Path, help="output file (default: stdout)")
+    parser.add_argument("--check", action="store_true", help="validate the generators")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    days = [
+        day
+        for day in select_days(discover_days(), args.year, args.day)
+        if day.generator_file.exists()
+    ]
+
+    if args.check:
+        failures = 0
+        for day in days:
+            try:
+                check_day(day)
+                print(f"{day.key}: ok")
+            except Exception as e:
+                failures += 1
+                print(f"{day.key}: {type(e).__name__}: {e}")
+        return 1 if failures else 0
+
+    if len(days) != 1:
+        print("Select exactly one day with --year and --day", file=sys.stderr)
+        return 2
+
+    options = dict(parse_option(option) for option in args.option)
+    text = generate_input(days[0], args.size, args.seed, **options)
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Character grids stored as one flat bytearray with a padded border.
+
+A cell is addressed by a single integer index, moving in a direction is adding
+one of the precomputed offsets, and the `pad` cells of `border` around the grid
+stop any walk before it can wrap around to another row:
+
+    grid = Grid.from_text(text, pad=1, border=b" ")
+    for idx in grid.find(b"0"):
+        for offset in grid.offsets4:
+            if grid.cells[idx + offset] == ord("1"):
+                ...
+
+Offsets are listed clockwise starting from north, so turning right is moving
+to the next offset of `offsets4`.
+"""
+
+from typing import Iterator
+
+BORDER = b"\0"
+
+
+class Grid:
+    def __init__(self, rows: list[bytes], pad: int = 1, border: bytes = BORDER):
+        self.nrows = len(rows)
+        self.ncols = len(rows[0]) if rows else 0
+        self.pad = pad
+        self.border = border[0]
+        self.width = self.ncols + 2 * pad
+
+        filler = border * pad
+        outer = border * (self.width * pad)
+        self.cells = bytearray(
+            outer + filler + (filler + filler).join(rows) + filler + outer
+        )
+
+        w = self.width
+        # clockwise from north: N, E, S, W and N, NE, E, SE, S, SW, W, NW
+        self.offsets4 = (-w, 1, w, -1)
+        self.offsets8 = (-w, -w + 1, 1, w + 1, w, w - 1, -1, -w - 1)
+
+    @classmethod
+    def from_text(cls, text: str, pad: int = 1, border: bytes = BORDER) -> "Grid":
+        rows = [line.strip().encode() for line in text.strip().splitlines()]
+        return cls(rows, pad, border)
+
+    def index(self, i: int, j: int) -> int:
+        return (i + self.pad) * self.width + j + self.pad
+
+    def position(self, idx: int) -> tuple[int, int]:
+        i, j = divmod(idx, self.width)
+        return i - self.pad, j - self.pad
+
+    def in_bounds(self, i: int, j: int) -> bool:
+        return 0 <= i < self.nrows and 0 <= j < self.ncols
+
+    def is_border(self, idx: int) -> bool:
+        return self.cells[idx] == self.border
+
+    def find(self, char: bytes) -> Iterator[int]:
+        """Indices of every cell holding `char`, in row-major order."""
+        cells = self.cells
+        idx = cells.find(char)
+        while idx != -1:
+            yield idx
+            idx = cells.find(char, idx + 1)
+
+    def indices(self) -> Iterator[int]:
+        """Indices of every cell inside the border, in row-major order."""
+        for i in range(self.nrows):
+            start = self.index(i, 0)
+            yield from range(start, start + self.ncols)
+
+    def rows(self) -> list[bytes]:
+        return [
+            bytes(self.cells[self.index(i, 0) : self.index(i, 0) + self.ncols])
+            for i in range(self.nrows)
+        ]
+
+    def __str__(self) -> str:
+        return "\n".join(row.decode() for row in self.rows())
+
+
+def tests():
+    grid = Grid.from_text(
+        """
+        abc
+        def
+        """
+    )
+    assert (grid.nrows, grid.ncols, grid.width) == (2, 3, 5)
+    assert str(grid) == "abc\ndef"
+
+    idx = grid.index(1, 1)
+    assert grid.cells[idx] == ord("e")
+    assert grid.position(idx) == (1, 1)
+    assert [chr(grid.cells[idx + off]) for off in grid.offsets4] == ["b", "f", "\0", "d"]
+    assert grid.is_border(grid.index(-1, 0)) and grid.is_border(grid.index(0, 3))
+    assert list(grid.find(b"e")) == [idx]
+    assert len(list(grid.indices())) == 6
+
+
+if __name__ == "__main__":
+    tests()
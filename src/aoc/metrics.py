@@ -0,0 +1,52 @@
+"""
+Opt-in counters for the hot loops of the solutions.
+
+Instrumented code guards every update with the module flag, so a disabled
+counter costs a single attribute lookup:
+
+    from aoc import metrics
+
+    if metrics.enabled:
+        metrics.incr("is_solvable.nodes")
+
+and the counts of a run are read back as a dict:
+
+    with metrics.collect() as counters:
+        part2(data)
+    print(dict(counters))
+
+Counters that can be derived after a loop (a distance walked, a cache's
+hit count) are added once at the end rather than on every iteration.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator
+
+enabled = False
+counters: Counter[str] = Counter()
+
+
+def incr(name: str, amount: int = 1) -> None:
+    counters[name] += amount
+
+
+def reset() -> None:
+    counters.clear()
+
+
+def as_dict() -> dict[str, int]:
+    return dict(counters)
+
+
+@contextmanager
+def collect() -> Iterator[Counter[str]]:
+    """Enables the counters, starting from zero, for the duration of the block."""
+    global enabled
+    previous = enabled
+    enabled = True
+    reset()
+    try:
+        yield counters
+    finally:
+        enabled = previous
@@ -0,0 +1,250 @@
+"""
+Bulk integer extraction for the puzzle parsers.
+
+The whole input is scanned at once instead of splitting every line and calling
+`int()` on each piece by hand:
+
+    ints("47|53\n97|13")            # [47, 53, 97, 13]
+    left, right = int_columns(text, 2)
+    reports = int_lists(text)       # one list per line, e.g. the 2024/2 reports
+    rows = int_rows(text)           # the same ragged rows stored flat:
+    rows.values, rows.offsets       # row i is values[offsets[i]:offsets[i + 1]]
+
+Every byte that is not a digit is a separator, so the same helpers read
+"190: 10 19", "75,47,61" or "3   4". A "-" is only read as a sign with
+`signed=True`, otherwise "1-3" gives [1, 3]. Lines without any integer (e.g.
+the blank line between two sections) do not make a row.
+
+`int_array` and `int_rows_array` do the same with NumPy, converting the digits
+of all the numbers in a few vectorized passes, a few MiB of text at a time to
+bound their temporaries. NumPy is optional: the rest of the module works
+without it.
+"""
+
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Callable, Iterator, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+Text = Union[str, bytes]
+
+_DIGITS = frozenset(b"0123456789")
+# every byte but the digits (and newlines, that end the rows) becomes a space
+_SEPARATORS = bytes(c if c in _DIGITS or c == ord("\n") else ord(" ") for c in range(256))
+_SIGNED_SEPARATORS = bytes(c if c == ord("-") else _SEPARATORS[c] for c in range(256))
+
+# the longest numbers whose digits can be summed up in an int64
+MAX_ARRAY_DIGITS = 18
+# bytes converted at once by the array parsers, the digit arithmetic takes
+# about 30 bytes of temporaries per byte of text
+ARRAY_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def _to_bytes(text: Text) -> bytes:
+    return text.encode() if isinstance(text, str) else text
+
+
+def _tokens(text: Text, signed: bool) -> bytes:
+    if not signed:
+        return _to_bytes(text).translate(_SEPARATORS)
+    # "7-3" is 7 and -3, a "-" not followed by digits is dropped by _split_signed
+    return _to_bytes(text).translate(_SIGNED_SEPARATORS).replace(b"-", b" -")
+
+
+def _split_signed(tokens: bytes) -> list[bytes]:
+    return [w for w in tokens.split() if w != b"-"]
+
+
+def _splitter(signed: bool) -> Callable[[bytes], list[bytes]]:
+    return _split_signed if signed else bytes.split
+
+
+def ints(text: Text, signed: bool = False) -> list[int]:
+    """Every integer of `text`, in order."""
+    return list(map(int, _splitter(signed)(_tokens(text, signed))))
+
+
+def int_lists(text: Text, signed: bool = False) -> list[list[int]]:
+    """The integers of every line holding at least one, one list per line."""
+    split = _splitter(signed)
+    lines = map(split, _tokens(text, signed).split(b"\n"))
+    return [list(map(int, words)) for words in lines if words]
+
+
+@dataclass(frozen=True)
+class IntRows:
+    """Ragged rows of integers stored flat: row i is values[offsets[i]:offsets[i + 1]]."""
+
+    values: list[int]
+    offsets: list[int]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> list[int]:
+        return self.values[self.offsets[i] : self.offsets[i + 1]]
+
+    def __iter__(self) -> Iterator[list[int]]:
+        values, offsets = self.values, self.offsets
+        for start, end in zip(offsets, offsets[1:]):
+            yield values[start:end]
+
+
+def int_rows(text: Text, signed: bool = False) -> IntRows:
+    """Same as `int_lists`, stored flat."""
+    split = _splitter(signed)
+    tokens = _tokens(text, signed)
+    values = list(map(int, split(tokens)))
+    counts = filter(None, map(len, map(split, tokens.split(b"\n"))))
+    return IntRows(values, [0, *accumulate(counts)])
+
+
+def int_columns(text: Text, ncols: int, signed: bool = False) -> list[list[int]]:
+    """The integers of a table with `ncols` integers per line, column by column."""
+    values = ints(text, signed)
+    if len(values) % ncols:
+        raise ValueError(f"{len(values)} integers do not fill {ncols} columns")
+    return [values[i::ncols] for i in range(ncols)]
+
+
+# ---------- NumPy ----------
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("NumPy is required for the array parsers")
+
+
+def _number_spans(buf: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """Start and end (exclusive) of every run of digits."""
+    is_digit = np.zeros(len(buf) + 2, dtype=bool)
+    is_digit[1:-1] = (buf >= ord("0")) & (buf <= ord("9"))
+    edges = np.flatnonzero(is_digit[1:] != is_digit[:-1])
+    return edges[0::2], edges[1::2]
+
+
+def _array_values(
+    buf: "np.ndarray", starts: "np.ndarray", ends: "np.ndarray", signed: bool
+) -> "np.ndarray":
+    lengths = ends - starts
+    if len(lengths) == 0:
+        return np.zeros(0, dtype=np.int64)
+    if lengths.max() > MAX_ARRAY_DIGITS:
+        raise OverflowError(f"numbers longer than {MAX_ARRAY_DIGITS} digits do not fit in int64")
+
+    is_digit = (buf >= ord("0")) & (buf <= ord("9"))
+    digits = buf[is_digit].astype(np.int64) - ord("0")
+    # power of ten of each digit: how far it is from the end of its number
+    number_ends = np.repeat(np.cumsum(lengths), lengths)
+    exponents = number_ends - np.arange(len(digits)) - 1
+    values = np.add.reduceat(digits * 10**exponents, np.cumsum(lengths) - lengths)
+
+    if signed:
+        has_sign = starts > 0
+        has_sign[has_sign] = buf[starts[has_sign] - 1] == ord("-")
+        values[has_sign] *= -1
+    return values
+
+
+def _array_chunks(buf: "np.ndarray", chunk_size: int) -> Iterator[tuple[int, int]]:
+    """Slices of about `chunk_size` bytes, cut after a byte that is neither a digit nor a sign."""
+    start, size = 0, len(buf)
+    while start < size:
+        end = min(start + chunk_size, size)
+        while end < size and (ord("0") <= buf[end - 1] <= ord("9") or buf[end - 1] == ord("-")):
+            end += 1
+        yield start, end
+        start = end
+
+
+def _int_spans(
+    buf: "np.ndarray", signed: bool, chunk_size: int = ARRAY_CHUNK_SIZE
+) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    values, starts, ends = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)], []
+    for start, end in _array_chunks(buf, chunk_size):
+        chunk = buf[start:end]
+        chunk_starts, chunk_ends = _number_spans(chunk)
+        values.append(_array_values(chunk, chunk_starts, chunk_ends, signed))
+        starts.append(chunk_starts + start)
+        ends.append(chunk_ends + start)
+    ends.append(np.zeros(0, dtype=np.int64))
+    return np.concatenate(values), np.concatenate(starts), np.concatenate(ends)
+
+
+def int_array(text: Text, signed: bool = False) -> "np.ndarray":
+    """Same as `ints`, as an int64 array."""
+    return int_spans_array(text, signed)[0]
+
+
+def int_spans_array(
+    text: Text, signed: bool = False
+) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    The integers of `text` with the byte offsets where their digits start and
+    end (exclusive), for parsers that also look at what surrounds them.
+    """
+    _require_numpy()
+    buf = np.frombuffer(_to_bytes(text), dtype=np.uint8)
+    return _int_spans(buf, signed)
+
+
+def int_rows_array(text: Text, signed: bool = False) -> tuple["np.ndarray", "np.ndarray"]:
+    """Same as `int_rows`, as int64 arrays (values, offsets)."""
+    _require_numpy()
+    buf = np.frombuffer(_to_bytes(text), dtype=np.uint8)
+    values, starts, _ = _int_spans(buf, signed)
+
+    # numbers found before each line break, lines without numbers repeat the
+    # previous offset and are dropped
+    line_ends = np.flatnonzero(buf == ord("\n"))
+    offsets = np.concatenate(([0], np.searchsorted(starts, line_ends), [len(starts)]))
+    return values, np.unique(offsets)
+
+
+def tests():
+    text = """
+        190: 10 19
+        3267: 81 40 27
+
+        75,47,61|53
+    """
+    assert ints(text) == [190, 10, 19, 3267, 81, 40, 27, 75, 47, 61, 53]
+    assert ints("x=-3, y=1-2") == [3, 1, 2]
+    assert ints("x=-3, y=1", signed=True) == [-3, 1]
+    assert ints("7-3 - --4", signed=True) == [7, -3, -4]
+    assert int_rows("1 -2\n-\n3", signed=True).offsets == [0, 2, 3]
+
+    rows = int_rows(text)
+    assert rows.offsets == [0, 3, 7, 11]
+    assert list(rows) == int_lists(text) == [[190, 10, 19], [3267, 81, 40, 27], [75, 47, 61, 53]]
+    assert len(rows) == 3 and rows[1] == [3267, 81, 40, 27]
+
+    assert int_columns("3   4\n4   3\n2   5", 2) == [[3, 4, 2], [4, 3, 5]]
+    try:
+        int_columns("1 2 3", 2)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected a ValueError")
+
+    if np is not None:
+        assert int_array(text).tolist() == ints(text)
+        assert int_array("-12 7-3", signed=True).tolist() == [-12, 7, -3]
+        values, offsets = int_rows_array(text)
+        assert values.tolist() == rows.values and offsets.tolist() == rows.offsets
+        assert int_array("no numbers").tolist() == []
+        values, starts, ends = int_spans_array("Game 12: 3 red")
+        assert (values.tolist(), starts.tolist(), ends.tolist()) == ([12, 3], [5, 9], [7, 10])
+        # chunks never cut a number or its sign
+        buf = np.frombuffer(b"12 -345 6-78", dtype=np.uint8)
+        for chunk_size in range(1, 8):
+            values, starts, ends = _int_spans(buf, True, chunk_size)
+            assert values.tolist() == [12, -345, 6, -78] and starts.tolist() == [0, 4, 8, 10]
+
+
+if __name__ == "__main__":
+    tests()
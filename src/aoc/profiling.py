@@ -0,0 +1,275 @@
+"""
+Profile the parse/part1/part2 phases of any day with cProfile and tracemalloc.
+
+Usage (from the src directory):
+
+    python -m aoc.profiling --year 2024 --day 10
+    python -m aoc.profiling --year 2024 --day 6 --input big.txt --top 30 -o prof.json
+    python -m aoc.profiling --year 2024 --day 9 --records
+
+Each phase is run twice, once under cProfile for the time spent per function and
+once under tracemalloc for memory, so neither tool distorts the other. Memory
+is reported as the peak reached during the phase (on top of what was already
+allocated when it started) and as the allocation sites still alive when it
+returns, e.g. the `@cache` of 2024/11 or `Guard.seen` in 2024/6.
+
+With --records the parsed input is measured instead: how many instances of
+the day's own classes it holds (e.g. `Equation` in 2024/7) and how many bytes
+each takes, plus the size of everything reachable from it.
+"""
+
+import argparse
+import cProfile
+import json
+import pstats
+import sys
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from aoc.days import Day, Solution, discover_days, select_days
+
+PHASES = ("parse", "part1", "part2")
+# the harness' own frames and allocations are left out of the reports, the
+# rest of aoc/ (e.g. grid.py, parsing.py) runs as part of the solutions
+HARNESS_FILES = tuple(
+    str(Path(__file__).parent / name) for name in ("profiling.py", "days.py", "runner.py")
+)
+
+
+@dataclass
+class FunctionStats:
+    function: str
+    ncalls: int
+    primitive_calls: int
+    tottime: float
+    cumtime: float
+
+
+@dataclass
+class AllocationSite:
+    site: str
+    size: int
+    count: int
+
+
+@dataclass
+class PhaseProfile:
+    phase: str
+    time: float
+    peak_memory: int
+    allocated_memory: int
+    top_functions: list[FunctionStats] = field(default_factory=list)
+    allocations: list[AllocationSite] = field(default_factory=list)
+
+
+@dataclass
+class RecordStats:
+    type: str
+    count: int
+    size: int
+
+    @property
+    def bytes_per_record(self) -> float:
+        return self.size / self.count
+
+
+def _own_size(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def _referents(obj: Any) -> list[Any]:
+    if isinstance(obj, dict):
+        return [*obj.keys(), *obj.values()]
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return list(obj)
+    values = list(vars(obj).values()) if hasattr(obj, "__dict__") else []
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if hasattr(obj, name) and name not in ("__dict__", "__weakref__"):
+                values.append(getattr(obj, name))
+    return values
+
+
+def record_sizes(obj: Any) -> tuple[list[RecordStats], int]:
+    """
+    Instances of the days' classes reachable from `obj`, with the bytes taken by
+    the instances themselves (and their `__dict__`), and the total size of all
+    the objects reachable from `obj`.
+    """
+    counts: Counter[str] = Counter()
+    sizes: Counter[str] = Counter()
+    total = 0
+    seen = set()
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+
+        size = _own_size(obj)
+        total += size
+        cls = type(obj)
+        if cls.__module__.startswith("aoc_day_"):
+            counts[cls.__qualname__] += 1
+            sizes[cls.__qualname__] += size
+        stack.extend(_referents(obj))
+
+    records = [RecordStats(name, counts[name], sizes[name]) for name in counts]
+    records.sort(key=lambda r: r.size, reverse=True)
+    return records, total
+
+
+def format_records(day: Day, records: list[RecordStats], total: int) -> str:
+    lines = [f"===== {day.key}: parsed input takes {_format_size(total)}"]
+    lines.append(f"{'count':>10}{'size':>12}{'bytes/record':>14}  type")
+    for r in records:
+        lines.append(
+            f"{r.count:>10}{_format_size(r.size):>12}{r.bytes_per_record:>14.1f}  {r.type}"
+        )
+    return "\n".join(lines)
+
+
+def _function_name(key: tuple[str, int, str]) -> str:
+    filename, line, name = key
+    if filename == "~":
+        return name
+    return f"{filename}:{line}({name})"
+
+
+def profile_time(func: Callable[[], Any], top: int) -> tuple[float, list[FunctionStats]]:
+    profiler = cProfile.Profile()
+    profiler.runcall(func)
+    stats = pstats.Stats(profiler)
+
+    functions = [
+        FunctionStats(_function_name(key), nc, cc, tt, ct)
+        for key, (cc, nc, tt, ct, _) in stats.stats.items()
+        if key[0] not in HARNESS_FILES and "_lsprof.Profiler" not in key[2]
+    ]
+    functions.sort(key=lambda f: f.cumtime, reverse=True)
+    return stats.total_tt, functions[:top]
+
+
+def profile_memory(func: Callable[[], Any], top: int) -> tuple[int, int, list[AllocationSite]]:
+    tracemalloc.start()
+    try:
+        start_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        # keep the result alive so the snapshot still sees what the phase built
+        result = func()
+        end_size, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        del result
+    finally:
+        tracemalloc.stop()
+
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)]
+        + [tracemalloc.Filter(False, path) for path in HARNESS_FILES]
+    )
+    sites = [
+        AllocationSite(str(stat.traceback), stat.size, stat.count)
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+    return peak - start_size, end_size - start_size, sites
+
+
+def _phase_function(solution: Solution, text: str, phase: str) -> Callable[[], Any]:
+    """A zero argument callable running `phase` on a freshly parsed, cache-free input."""
+    if phase == "parse":
+        solution.clear_caches()
+        parser = solution.parser(1)
+        return lambda: parser(text)
+
+    part = int(phase.removeprefix("part"))
+    parsed = solution.parse(text, part)
+    args = parsed if isinstance(parsed, tuple) else (parsed,)
+    func = solution.part_function(part)
+    solution.clear_caches()
+    return lambda: func(*args)
+
+
+def profile_day(day: Day, text: Optional[str] = None, top: int = 15) -> list[PhaseProfile]:
+    solution = day.load()
+    text = day.read_input() if text is None else text
+
+    profiles = []
+    for phase in PHASES:
+        total_time, functions = profile_time(_phase_function(solution, text, phase), top)
+        peak, allocated, sites = profile_memory(_phase_function(solution, text, phase), top)
+        profiles.append(PhaseProfile(phase, total_time, peak, allocated, functions, sites))
+    return profiles
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f}{unit}" if unit != "B" else f"{size}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+def format_report(day: Day, profiles: list[PhaseProfile]) -> str:
+    lines = [f"===== {day.key}"]
+    for p in profiles:
+        lines.append(
+            f"--- {p.phase}: {p.time * 1000:.1f}ms, peak memory {_format_size(p.peak_memory)}, "
+            f"still allocated {_format_size(p.allocated_memory)}"
+        )
+        lines.append(f"{'ncalls':>14}{'tottime':>10}{'cumtime':>10}  function")
+        for f in p.top_functions:
+            ncalls = str(f.ncalls) if f.ncalls == f.primitive_calls else f"{f.ncalls}/{f.primitive_calls}"
+            lines.append(f"{ncalls:>14}{f.tottime:>10.4f}{f.cumtime:>10.4f}  {f.function}")
+        lines.append(f"{'size':>14}{'count':>10}  allocation site")
+        for site in p.allocations:
+            lines.append(f"{_format_size(site.size):>14}{site.count:>10}  {site.site}")
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, nargs="+", help="years (default: all)")
+    parser.add_argument("--day", type=int, nargs="+", help="days (default: all)")
+    parser.add_argument("--input", type=Path, help="input file instead of the day's input.txt")
+    parser.add_argument("--top", type=int, default=15, help="rows per table")
+    parser.add_argument("-o", "--output", type=Path, help="also write the profiles as JSON")
+    parser.add_argument(
+        "--records", action="store_true", help="measure the records of the parsed input instead"
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    days = select_days(discover_days(), args.year, args.day)
+    text = args.input.read_text() if args.input else None
+
+    report = {}
+    for day in days:
+        if args.records:
+            solution = day.load()
+            records, total = record_sizes(
+                solution.parse(day.read_input() if text is None else text)
+            )
+            report[day.key] = {"total": total, "records": [asdict(r) for r in records]}
+            print(format_records(day, records, total), end="\n\n")
+            continue
+
+        profiles = profile_day(day, text, args.top)
+        report[day.key] = [asdict(p) for p in profiles]
+        print(format_report(day, profiles), end="\n\n")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Run any selection of days in a process pool and report per-part timings.
+
+Usage (from the src directory):
+
+    python -m aoc.runner                      # every day, table output
+    python -m aoc.runner --year 2024 --day 7 9 --format json
+    python -m aoc.runner --jobs 1 --tests     # sequential, run tests() first
+    python -m aoc.runner --metrics            # also report the hot loop counters
+
+Parsed inputs are cached on disk (see aoc/cache.py) unless --no-cache is given,
+and the answers of days whose code and input didn't change since their last run
+are returned straight away (see aoc/answers.py) unless --force is given.
+"""
+
+import argparse
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any, Callable, Iterable, Optional
+
+from aoc import metrics
+from aoc.answers import answer_key, load_answers, store_answers
+from aoc.days import Day, Solution, discover_days, select_days
+
+PARTS = (1, 2)
+
+
+@dataclass
+class DayResult:
+    day: str
+    parse_time: Optional[float] = None
+    part1: Any = None
+    part1_time: Optional[float] = None
+    part2: Any = None
+    part2_time: Optional[float] = None
+    part1_metrics: Optional[dict[str, int]] = None
+    part2_metrics: Optional[dict[str, int]] = None
+    cached: bool = False
+    error: Optional[str] = None
+
+    @property
+    def total_time(self) -> float:
+        times = [self.parse_time, self.part1_time, self.part2_time]
+        return sum(t for t in times if t is not None)
+
+
+def timed(func: Callable[..., Any], *args) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def solve_input(
+    solution: Solution,
+    text: str,
+    result: DayResult,
+    collect_metrics: bool = False,
+    use_cache: bool = False,
+) -> DayResult:
+    """Fills `result` with the answers and timings of both parts on `text`."""
+    for part in PARTS:
+        # parts may mutate their input (e.g. 2024/9), so each one gets a
+        # freshly parsed copy; only the first parse is reported
+        parsed, parse_time = timed(solution.parse, text, part, use_cache)
+        if result.parse_time is None:
+            result.parse_time = parse_time
+        with metrics.collect() if collect_metrics else nullcontext() as counters:
+            answer, part_time = timed(solution.solve, parsed, part)
+        setattr(result, f"part{part}", answer)
+        setattr(result, f"part{part}_time", part_time)
+        if collect_metrics:
+            setattr(result, f"part{part}_metrics", dict(counters))
+    return result
+
+
+def run_day(
+    day: Day,
+    run_tests: bool = False,
+    collect_metrics: bool = False,
+    use_cache: bool = False,
+    use_answers: bool = False,
+) -> DayResult:
+    result = DayResult(day.key)
+    try:
+        text = day.read_input()
+        if use_answers:
+            key = answer_key(day, text)
+            answers = load_answers(day, key)
+            if answers is not None:
+                result.part1, result.part2 = answers["part1"], answers["part2"]
+                result.cached = True
+                return result
+
+        solution = day.load()
+        if run_tests:
+            solution.run_tests()
+        solve_input(solution, text, result, collect_metrics, use_cache)
+
+        if use_answers:
+            answers = {"part1": result.part1, "part2": result.part2}
+            store_answers(day, key, day.input_file.name, answers)
+    except Exception:
+        result.error = traceback.format_exc(limit=-1).strip()
+    return result
+
+
+def run_days(
+    days: Iterable[Day],
+    jobs: Optional[int] = None,
+    run_tests: bool = False,
+    collect_metrics: bool = False,
+    use_cache: bool = False,
+    use_answers: bool = False,
+) -> list[DayResult]:
+    days = list(days)
+    run = partial(
+        run_day,
+        run_tests=run_tests,
+        collect_metrics=collect_metrics,
+        use_cache=use_cache,
+        use_answers=use_answers,
+    )
+    if jobs == 1:
+        return [run(day) for day in days]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(run, days))
+
+
+def _format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    return f"{seconds * 1000:.1f}ms"
+
+
+def format_table(results: list[DayResult]) -> str:
+    header = ["day", "parse", "part1", "time1", "part2", "time2", "total"]
+    rows = [header]
+    for r in results:
+        rows.append(
+            [
+                r.day,
+                _format_time(r.parse_time),
+                str(r.part1),
+                _format_time(r.part1_time),
+                str(r.part2),
+                _format_time(r.part2_time),
+                "cached" if r.cached else _format_time(r.total_time),
+            ]
+        )
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = []
+    for row, r in zip(rows, [None, *results]):
+        if r is not None and r.error:
+            lines.append(f"{r.day.ljust(widths[0])}  error: {r.error.splitlines()[-1]}")
+        else:
+            lines.append("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+    lines.insert(1, "  ".join("-" * w for w in widths))
+
+    cached = [r.day for r in results if r.cached]
+    recomputed = [r.day for r in results if not (r.cached or r.error)]
+    lines.append(f"cached answers ({len(cached)}): {', '.join(cached) or '-'}")
+    lines.append(f"recomputed ({len(recomputed)}): {', '.join(recomputed) or '-'}")
+
+    for r in results:
+        for part in PARTS:
+            for name, count in (getattr(r, f"part{part}_metrics") or {}).items():
+                lines.append(f"{r.day} part{part} {name}: {count}")
+    return "\n".join(lines)
+
+
+def format_json(results: list[DayResult]) -> str:
+    return json.dumps([asdict(r) for r in results], indent=4, default=str)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, nargs="+", help="years to run (default: all)")
+    parser.add_argument("--day", type=int, nargs="+", help="days to run (default: all)")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes"
+    )
+    parser.add_argument("--format", choices=["table", "json"], default="table")
+    parser.add_argument("--tests", action="store_true", help="run tests() before solving")
+    parser.add_argument("--metrics", action="store_true", help="collect hot loop counters")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="always parse the input from text"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="recompute answers even if they are stored"
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    days = select_days(discover_days(), args.year, args.day)
+    results = run_days(
+        days,
+        jobs=args.jobs,
+        run_tests=args.tests,
+        collect_metrics=args.metrics,
+        use_cache=not args.no_cache,
+        # tests and counters need the solutions to actually run
+        use_answers=not (args.force or args.tests or args.metrics),
+    )
+    print(format_table(results) if args.format == "table" else format_json(results))
+
+
+if __name__ == "__main__":
+    main()
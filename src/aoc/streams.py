@@ -0,0 +1,104 @@
+"""
+Reading inputs too large to load at once, and the command line of the day
+helpers that do it (2023 Day 1 scanner.py, 2024/3 tokenizer.py...):
+
+    parser = build_parser(__doc__, Path(__file__).parent / "input.txt")
+    parser.add_argument("-j", "--jobs", type=int, default=1)
+    args = parser.parse_args()
+    report(args.path, ("Part 1:", "Part 2:"), lambda: scan_file(args.path, args.jobs))
+
+`chunk_bounds` cuts a buffer into byte ranges for worker processes and
+`read_chunks` reads a file a block at a time, both cut anywhere or, given a
+separator, right after it so that no line is split.
+"""
+
+import argparse
+import mmap
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+def chunk_bounds(
+    buffer: Buffer, chunk_size: int, separator: Optional[bytes] = None
+) -> list[tuple[int, int]]:
+    """
+    Slices of about `chunk_size` bytes covering `buffer`, extended to the end of
+    the next `separator` if there is one.
+    """
+    bounds = []
+    start, size = 0, len(buffer)
+    while start < size:
+        end = min(start + chunk_size, size)
+        if separator is not None:
+            end = buffer.find(separator, start + chunk_size)
+            end = size if end == -1 else end + len(separator)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def read_chunks(
+    path: Path, chunk_size: int, separator: Optional[bytes] = None
+) -> Iterator[bytes]:
+    """
+    The content of the file at `path`, about `chunk_size` bytes at a time. With a
+    `separator`, the chunks end right after one (but the last).
+    """
+    with open(path, "rb") as f:
+        rest = b""
+        while block := f.read(chunk_size):
+            if separator is None:
+                yield block
+                continue
+            block = rest + block
+            cut = block.rfind(separator)
+            cut = 0 if cut == -1 else cut + len(separator)
+            if cut:
+                yield block[:cut]
+            rest = block[cut:]
+        if rest:
+            yield rest
+
+
+def build_parser(doc: str, default_path: Path) -> argparse.ArgumentParser:
+    """Command line of a helper: described by its docstring, reading an input path."""
+    parser = argparse.ArgumentParser(description=doc.strip().splitlines()[0])
+    parser.add_argument("path", type=Path, nargs="?", default=default_path)
+    return parser
+
+
+def report(path: Path, labels: Sequence[str], solve: Callable[[], Sequence[Any]]) -> None:
+    """Prints the answers of `solve` and how fast it went through the file at `path`."""
+    start = time.perf_counter()
+    answers = solve()
+    elapsed = time.perf_counter() - start
+    for label, answer in zip(labels, answers):
+        print(label, answer)
+    size = os.path.getsize(path) / 2**20
+    throughput = size / elapsed if elapsed else float("inf")
+    print(f"{size:.1f}MiB in {elapsed:.2f}s ({throughput:.1f}MiB/s)", file=sys.stderr)
+
+
+def tests():
+    text = b"12\n345\n6\n"
+    assert chunk_bounds(text, 4) == [(0, 4), (4, 8), (8, 9)]
+    # chunks smaller than a line still cut on line ends
+    assert chunk_bounds(text, 1, b"\n") == [(0, 3), (3, 7), (7, 9)]
+    assert chunk_bounds(b"1\n2", 1, b"\n") == [(0, 2), (2, 3)]
+    assert chunk_bounds(b"", 4) == []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "input.txt"
+        path.write_bytes(text + b"78")
+        assert list(read_chunks(path, 4)) == [b"12\n3", b"45\n6", b"\n78"]
+        assert list(read_chunks(path, 4, b"\n")) == [b"12\n", b"345\n", b"6\n", b"78"]
+
+
+if __name__ == "__main__":
+    tests()
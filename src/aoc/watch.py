@@ -0,0 +1,180 @@
+"""
+Keep every day loaded in one process and re-run a day as soon as it is saved.
+
+Usage (from the src directory):
+
+    python -m aoc.watch                     # every day
+    python -m aoc.watch --year 2024 --day 6 10 --interval 0.2
+
+Inputs are read and parsed once and kept in memory as pickles, so that each
+run gets a fresh copy (some parts mutate their input, e.g. 2024/9). When a
+solution file changes only that module is reloaded, then its tests() and both
+parts are run. Every other module of the day directory is watched as well:
+helpers such as 2024/3/tokenizer.py are loaded by the solutions, which are all
+reloaded to pick up their new version. The parsed input is reused as long as
+the parser's module (and the `aoc` modules it imports) is unchanged; editing
+`input.txt` or the parser triggers a new parse.
+"""
+
+import argparse
+import inspect
+import pickle
+import time
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional
+
+from aoc.cache import source_hash
+from aoc.days import Day, Solution, discover_days, select_days
+
+PARTS = (1, 2)
+
+
+@dataclass
+class WatchedDay:
+    day: Day
+    solution: Solution
+    mtimes: dict[Path, float]
+    text: str
+    # part -> (hash of the parser's module, pickled parsed input)
+    parsed: dict[int, tuple[str, bytes]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, day: Day) -> "WatchedDay":
+        return cls(day, day.load(), watched_mtimes(day), day.read_input())
+
+
+def watched_mtimes(day: Day) -> dict[Path, float]:
+    paths = [*sorted(day.path.glob("*.py")), day.input_file]
+    return {path: path.stat().st_mtime for path in paths}
+
+
+def reload_module(module: ModuleType) -> None:
+    # importlib.reload looks the module up again by name, which fails for the
+    # day modules as they are loaded from a file location rather than sys.path
+    module.__spec__.loader.exec_module(module)
+
+
+def _parser_source(watched: WatchedDay, part: int) -> str:
+    try:
+        return source_hash(Path(inspect.getsourcefile(watched.solution.parser(part))))
+    except (OSError, TypeError):
+        return ""
+
+
+def parsed_input(watched: WatchedDay, part: int) -> tuple[Any, float]:
+    """A fresh copy of the parsed input of `part` and the time spent parsing it."""
+    source = _parser_source(watched, part)
+    if part in watched.parsed and watched.parsed[part][0] == source:
+        try:
+            return pickle.loads(watched.parsed[part][1]), 0.0
+        except Exception:
+            # e.g. a class of the module lost an attribute, just parse again
+            pass
+
+    start = time.perf_counter()
+    parsed = watched.solution.parse(watched.text, part)
+    parse_time = time.perf_counter() - start
+    try:
+        watched.parsed[part] = (source, pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        watched.parsed.pop(part, None)
+    return parsed, parse_time
+
+
+def run(watched: WatchedDay) -> None:
+    stamp = time.strftime("%H:%M:%S")
+    try:
+        watched.solution.run_tests()
+    except Exception:
+        print(f"[{stamp}] {watched.day.key} tests failed:\n{traceback.format_exc()}")
+        return
+
+    report = [f"[{stamp}] {watched.day.key} tests ok"]
+    for part in PARTS:
+        try:
+            parsed, parse_time = parsed_input(watched, part)
+            start = time.perf_counter()
+            answer = watched.solution.solve(parsed, part)
+            part_time = time.perf_counter() - start
+        except Exception:
+            print("  ".join(report))
+            print(f"part {part} failed:\n{traceback.format_exc()}")
+            return
+        if parse_time:
+            report.append(f"parse {parse_time * 1000:.1f}ms")
+        report.append(f"part{part} {answer} ({part_time * 1000:.1f}ms)")
+    print("  ".join(report))
+
+
+def refresh(watched: WatchedDay) -> bool:
+    """Reloads what changed on disk, returns whether the day has to run again."""
+    try:
+        mtimes = watched_mtimes(watched.day)
+    except FileNotFoundError:
+        # editors may briefly remove a file while saving it
+        return False
+    changed = [path for path, mtime in mtimes.items() if watched.mtimes.get(path) != mtime]
+    if not changed:
+        return False
+    watched.mtimes = mtimes
+
+    modules = watched.solution.modules
+    to_reload = set()
+    for path in changed:
+        if path == watched.day.input_file:
+            watched.text = watched.day.read_input()
+            watched.parsed.clear()
+        elif path in modules:
+            to_reload.add(path)
+        else:
+            # a helper the solutions load when they run, e.g. 2024/3/tokenizer.py
+            to_reload.update(modules)
+
+    for path in sorted(to_reload):
+        try:
+            reload_module(modules[path])
+        except Exception:
+            print(f"{path} failed to reload:\n{traceback.format_exc()}")
+            return False
+    return True
+
+
+def watch(days: list[Day], interval: float = 0.5) -> None:
+    watched_days = [WatchedDay.load(day) for day in days]
+    for watched in watched_days:
+        # parse every input up front so that the first edit only pays the solve
+        try:
+            for part in PARTS:
+                parsed_input(watched, part)
+        except Exception:
+            print(f"{watched.day.key} failed to parse:\n{traceback.format_exc()}")
+    print(f"Watching {len(watched_days)} day(s), Ctrl+C to stop")
+
+    try:
+        while True:
+            for watched in watched_days:
+                if refresh(watched):
+                    run(watched)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, nargs="+", help="years (default: all)")
+    parser.add_argument("--day", type=int, nargs="+", help="days (default: all)")
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between polls")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    watch(select_days(discover_days(), args.year, args.day), args.interval)
+
+
+if __name__ == "__main__":
+    main()